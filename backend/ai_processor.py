@@ -7,6 +7,7 @@ based on actual NYC data and geographic intelligence
 from typing import Dict, Optional, List, Tuple, Any
 import json
 import re
+import zlib
 import numpy as np
 import requests
 import os
@@ -457,26 +458,29 @@ Be specific about NYC landmarks, neighborhoods, and geographic features."""
         description = ai_analysis.get("description", "")
         reduction_percent = ai_analysis.get("reduction_percent", 20.0)
         
-        # Create deterministic seed based on intervention details for consistency
-        unique_seed = hash(f"{borough}_{sector}_{description}_{reduction_percent}") % 2**32
-        np.random.seed(unique_seed)
+        # Create deterministic seed based on intervention details for consistency.
+        # crc32 is stable across processes (str hash() is salted), and the local
+        # Generator keeps concurrent requests off the global NumPy random state
+        unique_seed = zlib.crc32(f"{borough}_{sector}_{description}_{reduction_percent}".encode())
+        rng = np.random.default_rng(unique_seed)
         
         pattern_points = []
         
         # REAL NYC DATA-BASED PATTERNS (not random!)
         if sector == "transport":
-            pattern_points.extend(self._generate_transport_pattern(borough, description, reduction_percent))
+            pattern_points.extend(self._generate_transport_pattern(borough, description, reduction_percent, rng))
         elif sector == "buildings":
-            pattern_points.extend(self._generate_buildings_pattern(borough, description, reduction_percent))
+            pattern_points.extend(self._generate_buildings_pattern(borough, description, reduction_percent, rng))
         elif sector == "industry":
-            pattern_points.extend(self._generate_industry_pattern(borough, description, reduction_percent))
+            pattern_points.extend(self._generate_industry_pattern(borough, description, reduction_percent, rng))
         elif sector == "energy":
-            pattern_points.extend(self._generate_energy_pattern(borough, description, reduction_percent))
+            pattern_points.extend(self._generate_energy_pattern(borough, description, reduction_percent, rng))
         
         print(f"[AI] Generated {len(pattern_points)} REALISTIC spatial points for {sector} in {borough}")
         return pattern_points
     
-    def _generate_transport_pattern(self, borough: str, description: str, reduction_percent: float) -> List[Tuple]:
+    def _generate_transport_pattern(self, borough: str, description: str, reduction_percent: float,
+                                    rng: np.random.Generator) -> List[Tuple]:
         """Generate realistic transport intervention patterns based on real NYC data"""
         pattern_points = []
         
@@ -520,30 +524,31 @@ Be specific about NYC landmarks, neighborhoods, and geographic features."""
                 # Create realistic spread patterns based on intervention type
                 if 'taxi' in description.lower() or 'cab' in description.lower():
                     # Taxis cluster around commercial areas
-                    offset_lat = hub_lat + np.random.normal(0, 0.01)  # Tight clustering
-                    offset_lon = hub_lon + np.random.normal(0, 0.01)
-                    intensity = base_intensity * (0.8 + np.random.uniform(0, 0.4))
+                    offset_lat = hub_lat + rng.normal(0, 0.01)  # Tight clustering
+                    offset_lon = hub_lon + rng.normal(0, 0.01)
+                    intensity = base_intensity * (0.8 + rng.uniform(0, 0.4))
                 elif 'bus' in description.lower():
                     # Buses follow major routes
-                    offset_lat = hub_lat + np.random.normal(0, 0.015)  # Route-based spread
-                    offset_lon = hub_lon + np.random.normal(0, 0.015)
-                    intensity = base_intensity * (0.7 + np.random.uniform(0, 0.3))
+                    offset_lat = hub_lat + rng.normal(0, 0.015)  # Route-based spread
+                    offset_lon = hub_lon + rng.normal(0, 0.015)
+                    intensity = base_intensity * (0.7 + rng.uniform(0, 0.3))
                 elif 'ev' in description.lower() or 'electric' in description.lower():
                     # EVs cluster around charging infrastructure
-                    offset_lat = hub_lat + np.random.normal(0, 0.012)
-                    offset_lon = hub_lon + np.random.normal(0, 0.012)
-                    intensity = base_intensity * (0.9 + np.random.uniform(0, 0.2))
+                    offset_lat = hub_lat + rng.normal(0, 0.012)
+                    offset_lon = hub_lon + rng.normal(0, 0.012)
+                    intensity = base_intensity * (0.9 + rng.uniform(0, 0.2))
                 else:
                     # General transport patterns
-                    offset_lat = hub_lat + np.random.normal(0, 0.02)
-                    offset_lon = hub_lon + np.random.normal(0, 0.02)
-                    intensity = base_intensity * (0.6 + np.random.uniform(0, 0.4))
+                    offset_lat = hub_lat + rng.normal(0, 0.02)
+                    offset_lon = hub_lon + rng.normal(0, 0.02)
+                    intensity = base_intensity * (0.6 + rng.uniform(0, 0.4))
                 
                 pattern_points.append((offset_lat, offset_lon, intensity))
         
         return pattern_points
     
-    def _generate_buildings_pattern(self, borough: str, description: str, reduction_percent: float) -> List[Tuple]:
+    def _generate_buildings_pattern(self, borough: str, description: str, reduction_percent: float,
+                                    rng: np.random.Generator) -> List[Tuple]:
         """Generate realistic building intervention patterns based on real NYC data"""
         pattern_points = []
         
@@ -587,22 +592,23 @@ Be specific about NYC landmarks, neighborhoods, and geographic features."""
             
             for i in range(cluster_size):
                 # Create realistic building patterns
-                offset_lat = zone_lat + np.random.normal(0, 0.02)
-                offset_lon = zone_lon + np.random.normal(0, 0.02)
+                offset_lat = zone_lat + rng.normal(0, 0.02)
+                offset_lon = zone_lon + rng.normal(0, 0.02)
                 
                 # Intensity based on building type and intervention
                 if 'solar' in description.lower():
-                    intensity = base_intensity * (0.7 + np.random.uniform(0, 0.3))
+                    intensity = base_intensity * (0.7 + rng.uniform(0, 0.3))
                 elif 'roof' in description.lower():
-                    intensity = base_intensity * (0.6 + np.random.uniform(0, 0.4))
+                    intensity = base_intensity * (0.6 + rng.uniform(0, 0.4))
                 else:
-                    intensity = base_intensity * (0.5 + np.random.uniform(0, 0.5))
+                    intensity = base_intensity * (0.5 + rng.uniform(0, 0.5))
                 
                 pattern_points.append((offset_lat, offset_lon, intensity))
         
         return pattern_points
     
-    def _generate_industry_pattern(self, borough: str, description: str, reduction_percent: float) -> List[Tuple]:
+    def _generate_industry_pattern(self, borough: str, description: str, reduction_percent: float,
+                                   rng: np.random.Generator) -> List[Tuple]:
         """Generate realistic industrial intervention patterns based on real NYC data"""
         pattern_points = []
         
@@ -638,15 +644,16 @@ Be specific about NYC landmarks, neighborhoods, and geographic features."""
             
             for i in range(cluster_size):
                 # Industrial patterns are more concentrated
-                offset_lat = zone_lat + np.random.normal(0, 0.015)
-                offset_lon = zone_lon + np.random.normal(0, 0.015)
-                intensity = base_intensity * (0.8 + np.random.uniform(0, 0.2))
+                offset_lat = zone_lat + rng.normal(0, 0.015)
+                offset_lon = zone_lon + rng.normal(0, 0.015)
+                intensity = base_intensity * (0.8 + rng.uniform(0, 0.2))
                 
                 pattern_points.append((offset_lat, offset_lon, intensity))
         
         return pattern_points
     
-    def _generate_energy_pattern(self, borough: str, description: str, reduction_percent: float) -> List[Tuple]:
+    def _generate_energy_pattern(self, borough: str, description: str, reduction_percent: float,
+                                 rng: np.random.Generator) -> List[Tuple]:
         """Generate realistic energy intervention patterns based on real NYC data"""
         pattern_points = []
         
@@ -678,9 +685,9 @@ Be specific about NYC landmarks, neighborhoods, and geographic features."""
             cluster_size = int(base_intensity * reduction_percent * 2.5)
             
             for i in range(cluster_size):
-                offset_lat = zone_lat + np.random.normal(0, 0.02)
-                offset_lon = zone_lon + np.random.normal(0, 0.02)
-                intensity = base_intensity * (0.6 + np.random.uniform(0, 0.4))
+                offset_lat = zone_lat + rng.normal(0, 0.02)
+                offset_lon = zone_lon + rng.normal(0, 0.02)
+                intensity = base_intensity * (0.6 + rng.uniform(0, 0.4))
                 
                 pattern_points.append((offset_lat, offset_lon, intensity))
         
@@ -3,12 +3,47 @@ Comprehensive Data Loader
 Loads and processes all NYC emissions data sources for analysis
 """
 
-import json
+import os
+import pickle
+import re
+import sys
+import threading
+import orjson
 import pandas as pd
 import numpy as np
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime
+from dataclasses import dataclass, field
+from functools import cached_property
+
+from kernels import nan_sum, buildings_co2
+from unit_conversions import (
+    MILES_TO_KM, EMISSIONS_FACTORS_METRIC, KBTU_TO_KWH,
+    NYC_GRID_KG_CO2_PER_KWH, detect_unit_from_column_name
+)
+
+# Optional pyarrow for fast columnar reads of the large CSVs
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    import pyarrow.fs as pa_fs
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    print("[INFO] pyarrow not available, large CSVs will be read with pandas")
+
+# Optional shapely for the spatial point index
+try:
+    import shapely
+    from shapely import STRtree, box
+    SHAPELY_AVAILABLE = True
+except ImportError:
+    SHAPELY_AVAILABLE = False
+    print("[INFO] shapely not available, spatial queries will scan all points")
 
 # Optional geopandas for boundaries (not critical)
 try:
@@ -18,6 +53,119 @@ except ImportError:
     GEOPANDAS_AVAILABLE = False
     print("[INFO] geopandas not available, boundary data will be skipped")
 
+# Intervention directions, interned so every result shares one string object
+# and direction checks hit the identity fast path of str ==
+DIRECTION_DECREASE = sys.intern('decrease')
+DIRECTION_INCREASE = sys.intern('increase')
+
+
+@dataclass(slots=True)
+class EmissionsResult:
+    """Emissions impact of an intervention on one sector (tons CO2/year)"""
+    baseline_tons_co2: float
+    reduced_tons_co2: float
+    annual_savings_tons_co2: float
+    percentage_reduction: float
+    direction: str = DIRECTION_DECREASE
+    is_increase: bool = False
+    extras: Dict = field(default_factory=dict)  # Sector-specific values (e.g. annual_mwh)
+    
+    def to_dict(self) -> Dict:
+        """Flat dict form (extras merged in) for JSON responses"""
+        result = {
+            'baseline_tons_co2': self.baseline_tons_co2,
+            'reduced_tons_co2': self.reduced_tons_co2,
+            'annual_savings_tons_co2': self.annual_savings_tons_co2,
+            'percentage_reduction': self.percentage_reduction,
+            'direction': self.direction,
+            'is_increase': self.is_increase
+        }
+        result.update(self.extras)
+        return result
+
+
+# Row layout of get_transport_emissions_batch (one row per intervention)
+TRANSPORT_BATCH_DTYPE = np.dtype([
+    ('baseline_tons_co2', np.float64),
+    ('reduced_tons_co2', np.float64),
+    ('annual_savings_tons_co2', np.float64),
+    ('percentage_reduction', np.float64),
+    ('is_increase', np.bool_),
+])
+
+
+# Keywords in intervention text that pick out a specific airport (aliases on
+# top of each airport's own code; earlier airports win when several match)
+AIRPORT_KEYWORDS = {
+    'jfk': 'JFK',
+    'laguardia': 'LaGuardia',
+    'lga': 'LaGuardia',
+}
+# Airports an intervention covers when the text names none
+DEFAULT_TARGET_AIRPORTS = ['JFK', 'LaGuardia']
+
+
+def geodata_to_parquet(geojson_path: Path, geodata=None) -> Optional[Path]:
+    """
+    Write a GeoParquet copy (<name>.parquet) of a GeoJSON file
+    
+    GeoParquet loads as columnar WKB through pyarrow instead of a GDAL parse
+    of the GeoJSON text. Pass the already-read GeoDataFrame as geodata to
+    avoid reading the GeoJSON twice. Returns None if the copy could not be
+    written (e.g. pyarrow missing).
+    """
+    parquet_path = geojson_path.with_suffix('.parquet')
+    tmp_path = parquet_path.with_name(f"{parquet_path.name}.{os.getpid()}.tmp")
+    try:
+        if geodata is None:
+            geodata = gpd.read_file(geojson_path)
+        geodata.to_parquet(tmp_path)
+        os.replace(tmp_path, parquet_path)
+        return parquet_path
+    except Exception as e:
+        print(f"  [!] Could not write GeoParquet for {geojson_path.name}: {e}")
+        tmp_path.unlink(missing_ok=True)
+        return None
+
+
+def read_geodata_cached(geojson_path: Path):
+    """
+    Read a GeoJSON file, preferring an up-to-date GeoParquet copy
+    
+    The copy is memory-mapped, so worker processes reading the same file
+    share its pages through the OS page cache.
+    """
+    parquet_path = geojson_path.with_suffix('.parquet')
+    if parquet_path.exists() and parquet_path.stat().st_mtime > geojson_path.stat().st_mtime:
+        try:
+            return gpd.read_parquet(parquet_path, memory_map=True)
+        except Exception as e:
+            print(f"  [!] Stale GeoParquet {parquet_path.name}: {e}")
+    
+    geodata = gpd.read_file(geojson_path)
+    geodata_to_parquet(geojson_path, geodata)
+    return geodata
+
+
+class _dataset_property(cached_property):
+    """
+    cached_property whose getter runs at most once per instance
+    
+    functools.cached_property has no lock on Python 3.12+ (and a class-wide
+    one before that), so concurrent first accesses could parse the same file
+    twice. The getter runs under the instance's _load_lock instead.
+    """
+    
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        cache = instance.__dict__
+        with instance._load_lock:
+            if self.attrname not in cache:
+                cache[self.attrname] = self.func(instance)
+            return cache[self.attrname]
+
+
 class NYCDataLoader:
     """
     Loads all NYC emissions-related datasets and provides
@@ -26,130 +174,338 @@ class NYCDataLoader:
     
     def __init__(self, data_dir: str = "data/raw"):
         self.data_dir = Path(data_dir)
-        self.cache = {}
-        
-        print("[INIT] Loading NYC emissions data...")
-        self._load_all_data()
-        print("[OK] All data loaded successfully")
+        self._parquet_paths: Dict[Path, Optional[Path]] = {}
+        self._load_lock = threading.RLock()
+        self._building_baseline_cache: Dict[Optional[str], Tuple[float, int]] = {}
+        self._col_classify_cache: Dict[Path, Tuple[List[str], List[str]]] = {}
+        
+        # Sector datasets are parsed lazily on first access (see the
+        # cached properties below), so constructing the loader is cheap
+        print(f"[INIT] NYC emissions data loader ready ({self.data_dir})")
     
-    def _load_all_data(self):
-        """Load all available datasets into memory"""
-        # Load JSON reference data (small, fast)
-        self._load_aviation_data()
-        self._load_energy_data()
-        self._load_industry_data()
-        self._load_maritime_data()
-        self._load_transport_reference_data()
+    def _load_json_cached(self, path: Path) -> Dict:
+        """
+        Load a JSON reference file, reusing a pickled copy when it is up to date
+        
+        The reference JSON never changes between runs, so after the first parse
+        the decoded dict is pickled next to the source (<name>.pkl) and later
+        startups skip the JSON tokenizer entirely. The pickle records the
+        source's mtime and size and is only reused while both still match.
+        """
+        source_stat = path.stat()
+        source_key = (source_stat.st_mtime_ns, source_stat.st_size)
         
-        # Load geographic boundaries
-        self._load_boundaries()
+        pickle_path = path.with_suffix('.pkl')
+        if pickle_path.exists():
+            try:
+                with open(pickle_path, 'rb') as f:
+                    cached = pickle.load(f)
+                if cached.get('source') == source_key:
+                    return cached['data']
+            except Exception as e:
+                print(f"  [!] Stale pickle cache {pickle_path.name}: {e}")
         
-        # Large CSV files - load metadata only initially
-        self._load_csv_metadata()
+        data = orjson.loads(path.read_bytes())
         
-    def _load_aviation_data(self):
-        """Load aviation sector data"""
+        # Write to a temp file and rename, so readers never see a partial pickle
+        tmp_path = pickle_path.with_name(f"{pickle_path.name}.{os.getpid()}.tmp")
         try:
-            with open(self.data_dir / "aviation" / "airport_info.json") as f:
-                self.cache['aviation_airports'] = json.load(f)
-            
-            with open(self.data_dir / "aviation" / "emissions_factors.json") as f:
-                self.cache['aviation_emissions'] = json.load(f)
-            
-            print("  [OK] Aviation data loaded")
-        except Exception as e:
-            print(f"  [!] Aviation data: {e}")
-            self.cache['aviation_airports'] = {}
-            self.cache['aviation_emissions'] = {}
+            with open(tmp_path, 'wb') as f:
+                pickle.dump({'source': source_key, 'data': data}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, pickle_path)
+        except OSError as e:
+            print(f"  [!] Could not write pickle cache {pickle_path.name}: {e}")
+            tmp_path.unlink(missing_ok=True)
+        
+        return data
     
-    def _load_energy_data(self):
-        """Load energy sector data"""
+    def _load_reference_json(self, label: str, *parts: str) -> Dict:
+        """Load one reference JSON file, returning {} if it is missing or unreadable"""
         try:
-            with open(self.data_dir / "energy" / "energy_sources.json") as f:
-                self.cache['energy'] = json.load(f)
-            
-            print("  [OK] Energy data loaded")
+            data = self._load_json_cached(self.data_dir.joinpath(*parts))
+            print(f"  [OK] {label} loaded")
+            return data
         except Exception as e:
-            print(f"  [!] Energy data: {e}")
-            self.cache['energy'] = {}
+            print(f"  [!] {label}: {e}")
+            return {}
     
-    def _load_industry_data(self):
-        """Load industry sector data"""
-        try:
-            with open(self.data_dir / "industry" / "facilities_info.json") as f:
-                self.cache['industry_facilities'] = json.load(f)
-            
-            with open(self.data_dir / "industry" / "waste_management.json") as f:
-                self.cache['waste_management'] = json.load(f)
-            
-            print("  [OK] Industry data loaded")
-        except Exception as e:
-            print(f"  [!] Industry data: {e}")
-            self.cache['industry_facilities'] = {}
-            self.cache['waste_management'] = {}
+    def _ensure_parquet(self, csv_path: Path) -> Optional[Path]:
+        """
+        Return a Parquet copy of a large CSV, converting it on first use
+        
+        The CSV is streamed batch by batch into the Parquet writer, so the
+        conversion never holds the whole file in memory. Returns None when
+        pyarrow is unavailable or the conversion fails, in which case callers
+        fall back to reading the CSV with pandas.
+        """
+        if not PYARROW_AVAILABLE:
+            return None
+        
+        # Remember the outcome so a failed conversion is not retried per call
+        with self._load_lock:
+            if csv_path not in self._parquet_paths:
+                self._parquet_paths[csv_path] = self._convert_csv_to_parquet(csv_path)
+            return self._parquet_paths[csv_path]
     
-    def _load_maritime_data(self):
-        """Load maritime sector data"""
+    def _convert_csv_to_parquet(self, csv_path: Path) -> Optional[Path]:
+        """Stream a CSV into <name>.parquet unless an up-to-date copy exists"""
+        parquet_path = csv_path.with_suffix('.parquet')
+        if parquet_path.exists() and parquet_path.stat().st_mtime > csv_path.stat().st_mtime:
+            return parquet_path
+        
+        tmp_path = parquet_path.with_name(f"{parquet_path.name}.{os.getpid()}.tmp")
         try:
-            with open(self.data_dir / "maritime" / "port_info.json") as f:
-                self.cache['maritime'] = json.load(f)
-            
-            print("  [OK] Maritime data loaded")
+            print(f"  [...] Converting {csv_path.name} to Parquet (one-time)...")
+            reader = pa_csv.open_csv(csv_path)
+            with pq.ParquetWriter(tmp_path, reader.schema) as writer:
+                for batch in reader:
+                    writer.write_batch(batch)
+            os.replace(tmp_path, parquet_path)
+            print(f"  [OK] Wrote {parquet_path.name}")
+            return parquet_path
         except Exception as e:
-            print(f"  [!] Maritime data: {e}")
-            self.cache['maritime'] = {}
+            print(f"  [!] Parquet conversion failed for {csv_path.name}: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return None
     
-    def _load_transport_reference_data(self):
-        """Load transport reference data"""
-        try:
-            with open(self.data_dir / "transport" / "vehicle_registrations.json") as f:
-                self.cache['transport_vehicles'] = json.load(f)
-            
-            print("  [OK] Transport reference data loaded")
-        except Exception as e:
-            print(f"  [!] Transport data: {e}")
-            self.cache['transport_vehicles'] = {}
+    @staticmethod
+    def _read_csv_head(csv_path: Path, nrows: int) -> pd.DataFrame:
+        """
+        Read the first nrows of a CSV
+        
+        Streams 1 MB Arrow blocks and stops once enough rows are read, so only
+        the needed part of the file is parsed (multi-threaded, no intermediate
+        DataFrame). Falls back to pandas without pyarrow or when Arrow cannot
+        infer consistent column types.
+        """
+        if PYARROW_AVAILABLE:
+            try:
+                reader = pa_csv.open_csv(
+                    csv_path,
+                    read_options=pa_csv.ReadOptions(block_size=1 << 20),
+                    convert_options=pa_csv.ConvertOptions(strings_can_be_null=True)
+                )
+                batches = []
+                total = 0
+                for batch in reader:
+                    batches.append(batch)
+                    total += batch.num_rows
+                    if total >= nrows:
+                        break
+                table = pa.Table.from_batches(batches, schema=reader.schema)
+                return table.slice(0, nrows).to_pandas()
+            except pa.ArrowInvalid as e:
+                print(f"  [!] Arrow could not stream {csv_path.name}, using pandas: {e}")
+        
+        return pd.read_csv(csv_path, nrows=nrows)
+    
+    # ============================================================
+    # LAZY DATASETS
+    # ============================================================
+    
+    @_dataset_property
+    def aviation_airports(self) -> Dict:
+        """Airport locations and codes"""
+        return self._load_reference_json("Aviation airport data", "aviation", "airport_info.json")
+    
+    @_dataset_property
+    def aviation_emissions(self) -> Dict:
+        """Airport operations and aircraft emissions factors"""
+        return self._load_reference_json("Aviation emissions data", "aviation", "emissions_factors.json")
     
-    def _load_boundaries(self):
-        """Load geographic boundaries"""
+    @_dataset_property
+    def _aviation_airport_arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Airport operations as a struct of arrays, one entry per airport
+        
+        Annual LTO-cycle emissions (tons CO2) are precomputed per airport so
+        an intervention only has to mask and sum.
+        """
+        aviation_data = self.aviation_emissions
+        airport_ops = aviation_data.get('airport_operations', {})
+        lto_cycle = aviation_data.get('aircraft_emissions', {}).get('landing_takeoff_cycle', {})
+        
+        ops = list(airport_ops.values())
+        annual_ops = np.array([o.get('annual_operations', 0) for o in ops], dtype=np.float64)
+        narrow_pct = np.array([o.get('narrow_body_percentage', 0.65) for o in ops], dtype=np.float64)
+        wide_pct = np.array([o.get('wide_body_percentage', 0.30) for o in ops], dtype=np.float64)
+        regional_pct = np.array([o.get('regional_percentage', 0.05) for o in ops], dtype=np.float64)
+        
+        # Emissions per operation by aircraft mix (kg CO2)
+        kg_co2_per_op = (
+            narrow_pct * lto_cycle.get('narrow_body_kg_co2', 850) +
+            wide_pct * lto_cycle.get('wide_body_kg_co2', 2500) +
+            regional_pct * lto_cycle.get('regional_jet_kg_co2', 450)
+        )
+        
+        return {
+            'codes': np.array(list(airport_ops.keys()), dtype=str),
+            'annual_ops': annual_ops,
+            'narrow_pct': narrow_pct,
+            'wide_pct': wide_pct,
+            'regional_pct': regional_pct,
+            'annual_tons_co2': annual_ops * kg_co2_per_op / 1000,
+        }
+    
+    @_dataset_property
+    def _airport_keyword_table(self) -> Tuple["re.Pattern", Dict[str, str], Dict[str, int]]:
+        """
+        Keyword matcher for airports named in intervention text
+        
+        Returns (pattern, keyword -> airport code, airport code -> priority).
+        Built once from AIRPORT_KEYWORDS plus every airport code in the
+        operations data, so new airports need no code changes.
+        """
+        keywords = dict(AIRPORT_KEYWORDS)
+        for code in self._aviation_airport_arrays['codes']:
+            keywords.setdefault(code.lower(), str(code))
+        
+        # Longest keyword first so e.g. 'laguardia' is not cut short by a prefix
+        pattern = re.compile('|'.join(
+            re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True)
+        ))
+        priority = {code: rank for rank, code in enumerate(dict.fromkeys(keywords.values()))}
+        return pattern, keywords, priority
+    
+    @_dataset_property
+    def energy(self) -> Dict:
+        """Energy sector data"""
+        return self._load_reference_json("Energy data", "energy", "energy_sources.json")
+    
+    @_dataset_property
+    def industry_facilities(self) -> Dict:
+        """Industry facility locations"""
+        return self._load_reference_json("Industry data", "industry", "facilities_info.json")
+    
+    @_dataset_property
+    def waste_management(self) -> Dict:
+        """Waste generation and disposal data"""
+        return self._load_reference_json("Waste management data", "industry", "waste_management.json")
+    
+    @_dataset_property
+    def maritime(self) -> Dict:
+        """Maritime sector data"""
+        return self._load_reference_json("Maritime data", "maritime", "port_info.json")
+    
+    @_dataset_property
+    def transport_vehicles(self) -> Dict:
+        """Transport reference data"""
+        return self._load_reference_json("Transport reference data", "transport", "vehicle_registrations.json")
+    
+    @_dataset_property
+    def boundaries(self):
+        """Geographic boundaries (largest file, only read when asked for)"""
         if not GEOPANDAS_AVAILABLE:
             print("  [!] Boundaries skipped (geopandas not available)")
-            self.cache['boundaries'] = None
-            return
+            return None
         
         try:
             boundary_file = self.data_dir / "boundaries" / "borough_boundaries.geojson"
-            # Note: This is a large file, consider sampling if needed
             print("  [...] Loading boundaries (may take a moment)...")
-            self.cache['boundaries'] = gpd.read_file(boundary_file)
+            boundaries = read_geodata_cached(boundary_file)
             print("  [OK] Boundaries loaded")
+            return boundaries
         except Exception as e:
             print(f"  [!] Boundaries: {e}")
-            self.cache['boundaries'] = None
+            return None
     
-    def _load_csv_metadata(self):
-        """Load metadata about large CSV files without loading full data"""
-        self.cache['csv_files'] = {
+    @_dataset_property
+    def _fleet_arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Vehicle fleet composition and metric emissions factors as aligned arrays
+        
+        Order: gasoline, diesel, hybrid, electric. New fuel types only need an
+        entry in each array.
+        """
+        registrations = self.transport_vehicles.get('nyc_vehicle_registrations', {})
+        by_fuel = registrations.get('by_fuel_type', {})
+        
+        return {
+            'fuel_types': np.array(['gasoline', 'diesel', 'hybrid', 'electric']),
+            'counts': np.array([
+                by_fuel.get('gasoline', 1600000),
+                by_fuel.get('diesel', 300000),
+                by_fuel.get('hybrid', 150000),
+                by_fuel.get('electric', 40000),
+            ], dtype=np.float64),
+            # Metric emissions factors (kg CO2 per km, not mile)
+            'kg_co2_per_km': np.array([
+                EMISSIONS_FACTORS_METRIC['gasoline_kg_co2_per_km'],  # 0.242
+                EMISSIONS_FACTORS_METRIC['diesel_kg_co2_per_km'],    # 0.255
+                EMISSIONS_FACTORS_METRIC['hybrid_kg_co2_per_km'],    # 0.137
+                EMISSIONS_FACTORS_METRIC['electric_kg_co2_per_km'],  # 0.093
+            ], dtype=np.float64),
+        }
+    
+    @_dataset_property
+    def csv_files(self) -> Dict[str, Path]:
+        """Paths of the large CSV files (metadata only, never loaded in full)"""
+        csv_files = {
             'buildings': self.data_dir / "buildings" / "ll84_energy_water.csv",
             'traffic': self.data_dir / "transport" / "traffic_counts.csv",
             'trees': self.data_dir / "nature" / "tree_census.csv",
         }
         
-        for name, path in self.cache['csv_files'].items():
+        for name, path in csv_files.items():
             if path.exists():
                 size_mb = path.stat().st_size / (1024**2)
                 print(f"  [OK] {name.capitalize()} CSV available ({size_mb:.1f} MB)")
             else:
                 print(f"  [!] {name.capitalize()} CSV not found")
+        
+        return csv_files
+    
+    def preload(self):
+        """
+        Parse the reference datasets now instead of on first access
+        
+        Called once at server startup so sector lookups never parse files
+        inside a request handler. Boundaries stay lazy since the API does
+        not use them.
+        """
+        for name in ('aviation_airports', 'aviation_emissions', '_aviation_airport_arrays',
+                     '_airport_keyword_table', 'energy', 'industry_facilities', 'waste_management', 'maritime',
+                     'transport_vehicles', '_fleet_arrays', '_spatial_index', 'csv_files'):
+            getattr(self, name)
+        
+        if self.csv_files['buildings'].exists():
+            self._ensure_parquet(self.csv_files['buildings'])
     
     # ============================================================
     # DATA ACCESS METHODS
     # ============================================================
     
+    def _apply_intervention(
+        self,
+        baseline: float,
+        intervention: Dict,
+        extras: Optional[Dict] = None
+    ) -> EmissionsResult:
+        """
+        Apply an intervention's reduction to a baseline (tons CO2/year)
+        
+        Shared tail of every sector method. For decreases reduction_percent is
+        positive; for increases it is negative, so (1 - negative) increases.
+        """
+        reduction_percent = intervention.get('reduction_percent', 20)
+        # Directions parsed from request JSON are fresh strings; intern them
+        direction = sys.intern(str(intervention.get('direction', DIRECTION_DECREASE)))
+        reduction_pct = reduction_percent / 100.0
+        
+        return EmissionsResult(
+            baseline_tons_co2=baseline,
+            reduced_tons_co2=baseline * (1 - reduction_pct),
+            annual_savings_tons_co2=baseline * reduction_pct,
+            percentage_reduction=abs(reduction_percent),  # Absolute value for display
+            direction=direction,
+            is_increase=direction == DIRECTION_INCREASE,
+            extras=extras or {}
+        )
+    
     def get_aviation_emissions_for_intervention(
         self, 
         intervention: Dict
-    ) -> Dict[str, float]:
+    ) -> EmissionsResult:
         """
         Calculate aviation emissions impact based on intervention
         
@@ -157,75 +513,79 @@ class NYCDataLoader:
             intervention: Dict with keys like reduction_percent, description, specific_location
         
         Returns:
-            Dict with baseline_tons_co2, reduced_tons_co2, annual_savings
+            EmissionsResult with baseline, reduced and annual savings (tons CO2)
         """
-        aviation_data = self.cache.get('aviation_emissions', {})
-        airports_data = self.cache.get('aviation_airports', {})
-        
-        # Check if specific airport is mentioned
-        specific_location = intervention.get('specific_location', '')
-        description = intervention.get('description', '').lower()
-        
-        # Determine which airports to include
-        target_airports = []
-        if 'jfk' in specific_location.lower() or 'jfk' in description:
-            target_airports = ['JFK']
-        elif 'laguardia' in specific_location.lower() or 'lga' in description or 'laguardia' in description:
-            target_airports = ['LaGuardia']
+        # Check if specific airport is mentioned (one pass over the lowercased text)
+        text = f"{intervention.get('specific_location', '')} {intervention.get('description', '')}".lower()
+        pattern, keywords, priority = self._airport_keyword_table
+        tags = {keywords[m.group(0)] for m in pattern.finditer(text)}
+        
+        # Determine which airports to include (one airport if any is named)
+        if tags:
+            target_airports = [min(tags, key=priority.__getitem__)]
         else:
             # If no specific airport, use both NYC airports
-            target_airports = ['JFK', 'LaGuardia']
+            target_airports = DEFAULT_TARGET_AIRPORTS
         
         # Get baseline emissions for target airports only
-        baseline_emissions = 0
-        airport_ops = aviation_data.get('airport_operations', {})
-        lto_cycle = aviation_data.get('aircraft_emissions', {}).get('landing_takeoff_cycle', {})
+        airports = self._aviation_airport_arrays
+        target_mask = np.isin(airports['codes'], target_airports)
+        baseline_emissions = float(airports['annual_tons_co2'][target_mask].sum())
         
-        for airport, ops in airport_ops.items():
-            # Skip if not in target airports
-            if airport not in target_airports:
-                continue
-                
-            annual_ops = ops.get('annual_operations', 0)
-            narrow_pct = ops.get('narrow_body_percentage', 0.65)
-            wide_pct = ops.get('wide_body_percentage', 0.30)
-            regional_pct = ops.get('regional_percentage', 0.05)
-            
-            # Calculate emissions by aircraft type
-            narrow_emissions = annual_ops * narrow_pct * lto_cycle.get('narrow_body_kg_co2', 850) / 1000
-            wide_emissions = annual_ops * wide_pct * lto_cycle.get('wide_body_kg_co2', 2500) / 1000
-            regional_emissions = annual_ops * regional_pct * lto_cycle.get('regional_jet_kg_co2', 450) / 1000
-            
-            baseline_emissions += narrow_emissions + wide_emissions + regional_emissions
-            
-            print(f"[DATA] Calculated emissions for {airport}: {(narrow_emissions + wide_emissions + regional_emissions):,.0f} tons CO2/year")
+        for airport, emissions in zip(airports['codes'][target_mask], airports['annual_tons_co2'][target_mask]):
+            print(f"[DATA] Calculated emissions for {airport}: {emissions:,.0f} tons CO2/year")
         
-        # Apply intervention with explicit direction handling
-        reduction_pct = intervention.get('reduction_percent', 20) / 100.0
-        direction = intervention.get('direction', 'decrease')
+        return self._apply_intervention(baseline_emissions, intervention)
+    
+    def get_building_emissions_table(
+        self,
+        borough: Optional[str] = None,
+        sample_size: int = 1000,
+        columns: Optional[List[str]] = None
+    ) -> Optional["pa.Table"]:
+        """
+        Load a sample of building energy data as an Arrow table
         
-        # Calculate new emissions level
-        # For decreases: reduction_pct is positive, multiply by (1 - reduction_pct)
-        # For increases: reduction_pct is negative, so (1 - negative) = (1 + positive) which increases
-        reduced_emissions = baseline_emissions * (1 - reduction_pct)
-        annual_savings = baseline_emissions - reduced_emissions
+        Same sample as get_building_emissions_sample, without converting to
+        pandas. Returns None when the Parquet copy is unavailable (no pyarrow
+        or the conversion failed) so callers can fall back to pandas.
+        """
+        buildings_file = self.csv_files['buildings']
+        if not buildings_file.exists():
+            return None
         
-        # Get absolute percentage for display
-        abs_reduction_pct = abs(intervention.get('reduction_percent', 20))
+        parquet_path = self._ensure_parquet(buildings_file)
+        if parquet_path is None:
+            return None
         
-        return {
-            'baseline_tons_co2': baseline_emissions,
-            'reduced_tons_co2': reduced_emissions,
-            'annual_savings_tons_co2': annual_savings,
-            'percentage_reduction': abs_reduction_pct,
-            'direction': direction,
-            'is_increase': direction == 'increase'
-        }
+        # Memory-mapped reads share the file's pages across worker processes
+        dataset = ds.dataset(
+            parquet_path, format='parquet', filesystem=pa_fs.LocalFileSystem(use_mmap=True)
+        )
+        filter_borough = bool(borough) and 'borough' in dataset.schema.names
+        
+        read_columns = None
+        if columns is not None:
+            read_columns = list(columns)
+            if filter_borough and 'borough' not in read_columns:
+                read_columns.append('borough')
+        
+        # Sample the leading rows (columns projected), then filter in Arrow
+        table = dataset.head(sample_size, columns=read_columns)
+        if filter_borough:
+            mask = pc.match_substring(
+                table['borough'].cast(pa.string()), borough, ignore_case=True
+            )
+            table = table.filter(pc.fill_null(mask, False))
+        if columns is not None:
+            table = table.select(columns)
+        return table
     
     def get_building_emissions_sample(
         self,
         borough: Optional[str] = None,
-        sample_size: int = 1000
+        sample_size: int = 1000,
+        columns: Optional[List[str]] = None
     ) -> pd.DataFrame:
         """
         Load a sample of building energy data
@@ -233,108 +593,166 @@ class NYCDataLoader:
         Args:
             borough: Filter by borough (if available in data)
             sample_size: Number of rows to sample
+            columns: Only return these columns (all columns if None)
         
         Returns:
             DataFrame with building emissions data
         """
-        buildings_file = self.cache['csv_files']['buildings']
+        buildings_file = self.csv_files['buildings']
         
         if not buildings_file.exists():
             return pd.DataFrame()
         
         try:
+            table = self.get_building_emissions_table(borough, sample_size, columns)
+            if table is not None:
+                return table.to_pandas()
+            
             # Load sample
-            df = pd.read_csv(buildings_file, nrows=sample_size)
+            df = self._read_csv_head(buildings_file, sample_size)
             
             # Filter by borough if specified
             if borough and 'borough' in df.columns:
-                df = df[df['borough'].str.contains(borough, case=False, na=False)]
+                df = df[df['borough'].str.contains(borough, case=False, regex=False, na=False)]
+            
+            if columns is not None:
+                df = df[columns]
             
             return df
         except Exception as e:
             print(f"[ERROR] Loading buildings data: {e}")
             return pd.DataFrame()
     
+    def _classify_building_columns(self, path: Path) -> Tuple[List[str], List[str]]:
+        """
+        Find the GHG and energy columns of the buildings file from its header
+        
+        Column names are static for the dataset's lifetime, so the scan is
+        memoized per file.
+        """
+        if path not in self._col_classify_cache:
+            header = pd.read_csv(path, nrows=0).columns
+            
+            # Common column names in LL84 data
+            ghg_cols = [col for col in header if 'ghg' in col.lower() or 'emissions' in col.lower()]
+            energy_cols = [col for col in header if 'energy' in col.lower() or 'eui' in col.lower()]
+            self._col_classify_cache[path] = (ghg_cols, energy_cols)
+        
+        return self._col_classify_cache[path]
+    
     def get_building_emissions_for_intervention(
         self,
         intervention: Dict
-    ) -> Dict[str, float]:
+    ) -> EmissionsResult:
         """
         Calculate building sector emissions impact
         Uses actual building energy data
         """
-        # Load sample of buildings
-        df = self.get_building_emissions_sample(
-            borough=intervention.get('borough'),
-            sample_size=5000
-        )
+        baseline_emissions, buildings_analyzed = self._get_building_baseline(intervention.get('borough'))
         
-        if df.empty:
-            # Fallback to estimates
+        # If no valid baseline found, use estimate
+        if baseline_emissions == 0:
             return self._estimate_building_emissions(intervention)
         
-        # Calculate baseline from actual data
-        # Common column names in LL84 data
-        ghg_cols = [col for col in df.columns if 'ghg' in col.lower() or 'emissions' in col.lower()]
-        energy_cols = [col for col in df.columns if 'energy' in col.lower() or 'eui' in col.lower()]
+        return self._apply_intervention(baseline_emissions, intervention, extras={'buildings_analyzed': buildings_analyzed})
+    
+    def _get_building_baseline(self, borough: Optional[str]) -> Tuple[float, int]:
+        """
+        Baseline building emissions for a borough, computed once per borough
         
-        baseline_emissions = 0
+        The baseline only depends on the static buildings dataset, so every
+        intervention on the same borough shares one CSV read.
+        """
+        with self._load_lock:
+            if borough not in self._building_baseline_cache:
+                self._building_baseline_cache[borough] = self._compute_building_baseline(borough)
+            return self._building_baseline_cache[borough]
+    
+    def _compute_building_baseline(self, borough: Optional[str]) -> Tuple[float, int]:
+        """
+        Calculate baseline building emissions (tons CO2/year) from the LL84 sample
+        
+        Returns:
+            (baseline_tons_co2, buildings_analyzed); baseline is 0 when the
+            data gives no usable value and the caller should estimate instead
+        """
+        buildings_file = self.csv_files['buildings']
+        if not buildings_file.exists():
+            return 0.0, 0
+        
+        # Only the first GHG and energy columns are used, so read just those
+        try:
+            ghg_cols, energy_cols = self._classify_building_columns(buildings_file)
+        except Exception as e:
+            print(f"[ERROR] Reading buildings header: {e}")
+            return 0.0, 0
+        
+        # Load sample of buildings, staying in Arrow when the Parquet copy exists
+        sample_columns = list(dict.fromkeys(ghg_cols[:1] + energy_cols[:1]))
+        try:
+            data = self.get_building_emissions_table(borough, 5000, sample_columns)
+        except Exception as e:
+            print(f"[ERROR] Loading buildings data: {e}")
+            data = None
+        if data is not None:
+            num_rows = data.num_rows if data.num_columns else 0
+        else:
+            data = self.get_building_emissions_sample(borough, 5000, sample_columns)
+            num_rows = 0 if data.empty else len(data)
+        
+        if num_rows == 0:
+            return 0.0, 0
+        
+        # Calculate baseline from actual data
         if ghg_cols:
             try:
                 # Convert to numeric, coercing errors to NaN
-                ghg_values = pd.to_numeric(df[ghg_cols[0]], errors='coerce')
-                baseline_emissions = ghg_values.sum() / len(df) * 64169  # Scale to all buildings
-            except:
-                pass
+                baseline_emissions = self._numeric_sum(data[ghg_cols[0]]) / num_rows * 64169  # Scale to all buildings
+                if baseline_emissions != 0:
+                    return baseline_emissions, num_rows
+            except (ValueError, KeyError, TypeError) as e:
+                print(f"  [WARN] Could not sum {ghg_cols[0]}: {e}")
         
-        if baseline_emissions == 0 and energy_cols:
+        baseline_emissions = 0
+        if energy_cols:
             try:
                 # Estimate from energy use (typical: 0.35 kg CO2/kWh for NYC grid)
                 # NOTE: LL84 data often uses kBTU, need to convert to kWh
-                from unit_conversions import KBTU_TO_KWH, detect_unit_from_column_name, NYC_GRID_KG_CO2_PER_KWH
-                
                 energy_col_name = energy_cols[0]
                 unit_type = detect_unit_from_column_name(energy_col_name)
                 
-                energy_values = pd.to_numeric(df[energy_col_name], errors='coerce')
-                total_energy_raw = energy_values.sum()
+                # Convert to kWh if needed (otherwise assume already in kWh)
+                kwh_per_unit = KBTU_TO_KWH if unit_type == 'kbtu' else 1.0
                 
-                # Convert to kWh if needed
-                if unit_type == 'kbtu':
-                    total_energy_kwh = total_energy_raw * KBTU_TO_KWH
-                else:
-                    # Assume already in kWh
-                    total_energy_kwh = total_energy_raw
-                
-                # NYC grid emissions factor
-                baseline_emissions = total_energy_kwh * NYC_GRID_KG_CO2_PER_KWH / 1000  # Convert to tons
-            except:
-                pass
-        
-        # If no valid baseline found, use estimate
-        if baseline_emissions == 0:
-            return self._estimate_building_emissions(intervention)
-        
-        # Apply intervention with explicit direction handling
-        reduction_pct = intervention.get('reduction_percent', 20) / 100.0
-        direction = intervention.get('direction', 'decrease')
-        
-        reduced_emissions = baseline_emissions * (1 - reduction_pct)
-        annual_savings = baseline_emissions - reduced_emissions
-        
-        abs_reduction_pct = abs(intervention.get('reduction_percent', 20))
-        
-        return {
-            'baseline_tons_co2': baseline_emissions,
-            'reduced_tons_co2': reduced_emissions,
-            'annual_savings_tons_co2': annual_savings,
-            'percentage_reduction': abs_reduction_pct,
-            'direction': direction,
-            'is_increase': direction == 'increase',
-            'buildings_analyzed': len(df)
-        }
+                # NYC grid emissions factor, converted to tons in the same pass
+                baseline_emissions = buildings_co2(
+                    self._numeric_values(data[energy_col_name]), kwh_per_unit, NYC_GRID_KG_CO2_PER_KWH
+                )
+            except (ValueError, KeyError, TypeError) as e:
+                print(f"  [WARN] Could not estimate from {energy_cols[0]}: {e}")
+        
+        return baseline_emissions, num_rows
     
-    def _estimate_building_emissions(self, intervention: Dict) -> Dict[str, float]:
+    @staticmethod
+    def _numeric_sum(column) -> float:
+        """Sum a data column, skipping missing and non-numeric entries"""
+        if PYARROW_AVAILABLE and isinstance(column, pa.ChunkedArray):
+            if pa.types.is_integer(column.type) or pa.types.is_floating(column.type):
+                # Arrow's kernel skips nulls; an all-null column sums to None
+                return pc.sum(column.cast(pa.float64())).as_py() or 0.0
+            column = column.to_pandas()
+        return nan_sum(pd.to_numeric(column, errors='coerce').to_numpy(dtype=np.float64))
+    
+    @staticmethod
+    def _numeric_values(column) -> np.ndarray:
+        """A data column as float64, with missing and non-numeric entries as NaN"""
+        if PYARROW_AVAILABLE and isinstance(column, pa.ChunkedArray):
+            if pa.types.is_integer(column.type) or pa.types.is_floating(column.type):
+                return column.cast(pa.float64()).to_numpy()
+            column = column.to_pandas()
+        return pd.to_numeric(column, errors='coerce').to_numpy(dtype=np.float64)
+    
+    def _estimate_building_emissions(self, intervention: Dict) -> EmissionsResult:
         """Fallback building emissions estimate"""
         # NYC buildings emit ~30 million tons CO2/year
         baseline = 30000000
@@ -352,110 +770,99 @@ class NYCDataLoader:
         if borough in borough_factors:
             baseline *= borough_factors[borough]
         
-        reduction_pct = intervention.get('reduction_percent', 20) / 100.0
-        direction = intervention.get('direction', 'decrease')
-        reduced = baseline * (1 - reduction_pct)
-        
-        abs_reduction_pct = abs(intervention.get('reduction_percent', 20))
-        
-        return {
-            'baseline_tons_co2': baseline,
-            'reduced_tons_co2': reduced,
-            'annual_savings_tons_co2': baseline - reduced,
-            'percentage_reduction': abs_reduction_pct,
-            'direction': direction,
-            'is_increase': direction == 'increase'
-        }
+        return self._apply_intervention(baseline, intervention)
     
     def get_transport_emissions_for_intervention(
         self,
         intervention: Dict
-    ) -> Dict[str, float]:
+    ) -> EmissionsResult:
         """
         Calculate transportation emissions impact
         Uses vehicle fleet data and emissions factors
         """
-        vehicle_data = self.cache.get('transport_vehicles', {})
-        registrations = vehicle_data.get('nyc_vehicle_registrations', {})
-        emissions_factors = vehicle_data.get('emissions_factors', {})
+        baseline_emissions = self._transport_baseline(intervention.get('subsector', 'general'))
+        return self._apply_intervention(baseline_emissions, intervention)
+    
+    def get_transport_emissions_batch(self, interventions: List[Dict]) -> np.ndarray:
+        """
+        Calculate transportation emissions impact for many interventions at once
         
-        # Calculate baseline emissions
-        # NOTE: Converting imperial (miles) to metric (km) for consistency with grid
-        from unit_conversions import MILES_TO_KM, EMISSIONS_FACTORS_METRIC
+        For sensitivity analyses: baselines are computed once per subsector and
+        the reductions are applied as one array op. Returns a structured array
+        with one row per intervention (same fields as EmissionsResult).
+        """
+        n = len(interventions)
+        reduction_percent = np.fromiter(
+            (i.get('reduction_percent', 20) for i in interventions), dtype=np.float64, count=n
+        )
+        is_increase = np.fromiter(
+            (i.get('direction', DIRECTION_DECREASE) == DIRECTION_INCREASE for i in interventions), dtype=np.bool_, count=n
+        )
         
-        total_vehicles = registrations.get('total_vehicles', 2100000)
+        subsector_baselines = {}
+        baseline = np.empty(n, dtype=np.float64)
+        for idx, intervention in enumerate(interventions):
+            subsector = intervention.get('subsector', 'general')
+            if subsector not in subsector_baselines:
+                subsector_baselines[subsector] = self._transport_baseline(subsector)
+            baseline[idx] = subsector_baselines[subsector]
+        
+        r = reduction_percent / 100.0
+        result = np.empty(n, dtype=TRANSPORT_BATCH_DTYPE)
+        result['baseline_tons_co2'] = baseline
+        result['reduced_tons_co2'] = baseline * (1 - r)
+        result['annual_savings_tons_co2'] = baseline * r
+        result['percentage_reduction'] = np.abs(reduction_percent)
+        result['is_increase'] = is_increase
+        return result
+    
+    def _transport_baseline(self, subsector: str) -> float:
+        """Baseline transportation emissions (tons CO2/year) for a subsector"""
+        vehicle_data = self.transport_vehicles
         
+        # NOTE: Converting imperial (miles) to metric (km) for consistency with grid
         # Average vehicle distance traveled per year in NYC
         # Source data is in miles (US standard), convert to km
         avg_vmt_miles = 8000  # miles/year (from US EPA/DOT data)
         avg_vkt_km = avg_vmt_miles * MILES_TO_KM  # 12,875 km/year
         
-        # Fleet composition
-        by_fuel = registrations.get('by_fuel_type', {})
-        gasoline_vehicles = by_fuel.get('gasoline', 1600000)
-        diesel_vehicles = by_fuel.get('diesel', 300000)
-        hybrid_vehicles = by_fuel.get('hybrid', 150000)
-        electric_vehicles = by_fuel.get('electric', 40000)
-        
-        # Use metric emissions factors (kg CO2 per km, not mile)
-        gasoline_ef = EMISSIONS_FACTORS_METRIC['gasoline_kg_co2_per_km']  # 0.242
-        diesel_ef = EMISSIONS_FACTORS_METRIC['diesel_kg_co2_per_km']      # 0.255
-        hybrid_ef = EMISSIONS_FACTORS_METRIC['hybrid_kg_co2_per_km']      # 0.137
-        electric_ef = EMISSIONS_FACTORS_METRIC['electric_kg_co2_per_km']  # 0.093
-        
-        # Calculate baseline emissions (tons CO2/year)
-        baseline_emissions = (
-            gasoline_vehicles * avg_vkt_km * gasoline_ef / 1000 +
-            diesel_vehicles * avg_vkt_km * diesel_ef / 1000 +
-            hybrid_vehicles * avg_vkt_km * hybrid_ef / 1000 +
-            electric_vehicles * avg_vkt_km * electric_ef / 1000
-        )
+        # Calculate baseline emissions (tons CO2/year) over the whole fleet
+        fleet = self._fleet_arrays
+        baseline_emissions = self._fleet_tons_co2(fleet['counts'], avg_vkt_km, fleet['kg_co2_per_km'])
+        gasoline_ef, diesel_ef = fleet['kg_co2_per_km'][:2]
         
         # Sector-specific adjustments
-        subsector = intervention.get('subsector', 'general')
         if subsector == 'taxis':
             # Taxi fleet is smaller, higher mileage
             taxi_data = vehicle_data.get('taxi_fleet', {})
             taxi_fleet = taxi_data.get('yellow_cabs', 13500) + taxi_data.get('for_hire_vehicles', 80000)
             taxi_vmt_miles = taxi_data.get('average_daily_miles', 180) * 365
             taxi_vkt_km = taxi_vmt_miles * MILES_TO_KM
-            baseline_emissions = taxi_fleet * taxi_vkt_km * gasoline_ef / 1000
+            baseline_emissions = self._fleet_tons_co2([taxi_fleet], taxi_vkt_km, gasoline_ef)
         elif subsector == 'bus':
             # Bus fleet
             bus_data = vehicle_data.get('bus_fleet', {})
             bus_fleet = bus_data.get('mta_buses', 5800)
             bus_vmt_miles = bus_data.get('average_daily_miles_per_bus', 150) * 365
             bus_vkt_km = bus_vmt_miles * MILES_TO_KM
-            baseline_emissions = bus_fleet * bus_vkt_km * diesel_ef / 1000
+            baseline_emissions = self._fleet_tons_co2([bus_fleet], bus_vkt_km, diesel_ef)
         
-        # Apply intervention with explicit direction handling
-        reduction_pct = intervention.get('reduction_percent', 20) / 100.0
-        direction = intervention.get('direction', 'decrease')
-        
-        reduced_emissions = baseline_emissions * (1 - reduction_pct)
-        annual_savings = baseline_emissions - reduced_emissions
-        
-        # Get absolute percentage for display
-        abs_reduction_pct = abs(intervention.get('reduction_percent', 20))
-        
-        return {
-            'baseline_tons_co2': baseline_emissions,
-            'reduced_tons_co2': reduced_emissions,
-            'annual_savings_tons_co2': annual_savings,
-            'percentage_reduction': abs_reduction_pct,
-            'direction': direction,
-            'is_increase': direction == 'increase'
-        }
+        return baseline_emissions
+    
+    @staticmethod
+    def _fleet_tons_co2(counts, vkt_km: float, kg_co2_per_km) -> float:
+        """Annual fleet emissions (tons CO2/year) as one vectorized product-sum"""
+        return float((np.asarray(counts, dtype=np.float64) * vkt_km * kg_co2_per_km).sum()) / 1000
     
     def get_energy_emissions_for_intervention(
         self,
         intervention: Dict
-    ) -> Dict[str, float]:
+    ) -> EmissionsResult:
         """
         Calculate energy sector emissions impact
         Uses grid data and power plant information
         """
-        energy_data = self.cache.get('energy', {})
+        energy_data = self.energy
         grid = energy_data.get('nyc_power_grid', {})
         emissions_factors = energy_data.get('emissions_factors', {})
         
@@ -468,29 +875,12 @@ class NYCDataLoader:
         grid_factor = emissions_factors.get('grid_average_kg_co2_per_mwh', 350)
         baseline_emissions = annual_mwh * grid_factor / 1000  # Convert to tons
         
-        # Apply intervention with explicit direction handling
-        reduction_pct = intervention.get('reduction_percent', 20) / 100.0
-        direction = intervention.get('direction', 'decrease')
-        
-        reduced_emissions = baseline_emissions * (1 - reduction_pct)
-        annual_savings = baseline_emissions - reduced_emissions
-        
-        abs_reduction_pct = abs(intervention.get('reduction_percent', 20))
-        
-        return {
-            'baseline_tons_co2': baseline_emissions,
-            'reduced_tons_co2': reduced_emissions,
-            'annual_savings_tons_co2': annual_savings,
-            'percentage_reduction': abs_reduction_pct,
-            'direction': direction,
-            'is_increase': direction == 'increase',
-            'annual_mwh': annual_mwh
-        }
+        return self._apply_intervention(baseline_emissions, intervention, extras={'annual_mwh': annual_mwh})
     
     def get_industry_emissions_for_intervention(
         self,
         intervention: Dict
-    ) -> Dict[str, float]:
+    ) -> EmissionsResult:
         """
         Calculate industry sector emissions impact
         """
@@ -500,7 +890,7 @@ class NYCDataLoader:
         # Adjust by subsector
         subsector = intervention.get('subsector', 'general')
         if subsector == 'waste':
-            waste_data = self.cache.get('waste_management', {})
+            waste_data = self.waste_management
             waste_gen = waste_data.get('waste_generation', {})
             annual_tons = waste_gen.get('annual_tons', {}).get('total', 14000000)
             
@@ -509,29 +899,13 @@ class NYCDataLoader:
             methane_factor = waste_data.get('emissions', {}).get('landfill_methane_tons_co2e_per_ton_waste', 0.5)
             baseline_emissions = annual_tons * landfill_pct * methane_factor
         
-        # Apply intervention with explicit direction handling
-        reduction_pct = intervention.get('reduction_percent', 20) / 100.0
-        direction = intervention.get('direction', 'decrease')
-        
-        reduced_emissions = baseline_emissions * (1 - reduction_pct)
-        annual_savings = baseline_emissions - reduced_emissions
-        
-        abs_reduction_pct = abs(intervention.get('reduction_percent', 20))
-        
-        return {
-            'baseline_tons_co2': baseline_emissions,
-            'reduced_tons_co2': reduced_emissions,
-            'annual_savings_tons_co2': annual_savings,
-            'percentage_reduction': abs_reduction_pct,
-            'direction': direction,
-            'is_increase': direction == 'increase'
-        }
+        return self._apply_intervention(baseline_emissions, intervention)
     
     def get_emissions_for_sector(
         self,
         sector: str,
         intervention: Dict
-    ) -> Dict[str, float]:
+    ) -> EmissionsResult:
         """
         Main method to get emissions calculations for any sector
         
@@ -540,9 +914,9 @@ class NYCDataLoader:
             intervention: Dict with intervention details
         
         Returns:
-            Dict with emissions calculations
+            EmissionsResult with emissions calculations
         """
-        sector = sector.lower()
+        sector = sys.intern(sector.lower())
         
         if sector == 'aviation':
             return self.get_aviation_emissions_for_intervention(intervention)
@@ -559,7 +933,7 @@ class NYCDataLoader:
         else:
             return self._get_generic_emissions(intervention)
     
-    def _get_nature_sequestration(self, intervention: Dict) -> Dict[str, float]:
+    def _get_nature_sequestration(self, intervention: Dict) -> EmissionsResult:
         """Calculate carbon sequestration from nature-based solutions"""
         # Average urban tree sequesters ~20 kg CO2/year
         tree_factor = 20 / 1000  # tons CO2/tree/year
@@ -574,33 +948,20 @@ class NYCDataLoader:
         # Sequestration (negative = removes CO2)
         annual_sequestration = new_trees * tree_factor
         
-        return {
-            'baseline_tons_co2': 0,
-            'reduced_tons_co2': -annual_sequestration,
-            'annual_savings_tons_co2': annual_sequestration,
-            'percentage_reduction': magnitude,
-            'trees_planted': new_trees
-        }
+        return EmissionsResult(
+            baseline_tons_co2=0,
+            reduced_tons_co2=-annual_sequestration,
+            annual_savings_tons_co2=annual_sequestration,
+            percentage_reduction=magnitude,
+            extras={'trees_planted': new_trees}
+        )
     
-    def _get_generic_emissions(self, intervention: Dict) -> Dict[str, float]:
+    def _get_generic_emissions(self, intervention: Dict) -> EmissionsResult:
         """Generic emissions calculation fallback"""
         # NYC total emissions ~50 million tons CO2/year
         baseline = 50000000
         
-        reduction_pct = intervention.get('reduction_percent', 20) / 100.0
-        direction = intervention.get('direction', 'decrease')
-        reduced = baseline * (1 - reduction_pct)
-        
-        abs_reduction_pct = abs(intervention.get('reduction_percent', 20))
-        
-        return {
-            'baseline_tons_co2': baseline,
-            'reduced_tons_co2': reduced,
-            'annual_savings_tons_co2': baseline - reduced,
-            'percentage_reduction': abs_reduction_pct,
-            'direction': direction,
-            'is_increase': direction == 'increase'
-        }
+        return self._apply_intervention(baseline, intervention)
     
     def get_spatial_data_for_sector(
         self,
@@ -613,64 +974,104 @@ class NYCDataLoader:
         Returns:
             List of (lat, lon, intensity) tuples
         """
-        spatial_points = []
-        
-        if sector == 'aviation':
-            # Use actual airport locations
-            airports = self.cache.get('aviation_airports', {}).get('airport_codes', {})
-            for code, data in airports.items():
-                spatial_points.append((
-                    data.get('lat', 40.7),
-                    data.get('lon', -73.9),
-                    1.0  # Full intensity at airport
-                ))
+        index = self._spatial_index
+        mask = index['sectors'] == sector
+        return list(zip(
+            index['lats'][mask].tolist(),
+            index['lons'][mask].tolist(),
+            index['intensities'][mask].tolist()
+        ))
+    
+    def get_spatial_points_in_bbox(
+        self,
+        south: float,
+        west: float,
+        north: float,
+        east: float,
+        sector: Optional[str] = None
+    ) -> List[Tuple[float, float, float]]:
+        """
+        Get spatial points (optionally for one sector) inside a lat/lon box
         
-        elif sector == 'energy':
-            # Use actual power plant locations
-            plants = self.cache.get('energy', {}).get('major_substations', [])
-            for plant in plants:
-                loc = plant.get('location', {})
-                spatial_points.append((
-                    loc.get('lat', 40.7),
-                    loc.get('lon', -73.9),
-                    0.8
-                ))
+        Returns:
+            List of (lat, lon, intensity) tuples
+        """
+        index = self._spatial_index
+        if index['tree'] is not None:
+            hits = np.sort(index['tree'].query(box(west, south, east, north), predicate='intersects'))
+        else:
+            hits = np.flatnonzero(
+                (index['lats'] >= south) & (index['lats'] <= north) &
+                (index['lons'] >= west) & (index['lons'] <= east)
+            )
+        
+        if sector is not None:
+            hits = hits[index['sectors'][hits] == sector]
+        
+        return list(zip(
+            index['lats'][hits].tolist(),
+            index['lons'][hits].tolist(),
+            index['intensities'][hits].tolist()
+        ))
+    
+    @_dataset_property
+    def _spatial_index(self) -> Dict[str, np.ndarray]:
+        """
+        Point locations of airports, substations, facilities and ports
         
-        elif sector == 'industry':
-            # Use actual facility locations
-            facilities = self.cache.get('industry_facilities', {})
-            for facility_type in ['power_plants', 'waste_facilities', 'manufacturing']:
-                for facility in facilities.get(facility_type, []):
-                    loc = facility.get('location', {})
-                    if loc:
-                        spatial_points.append((
-                            loc.get('lat', 40.7),
-                            loc.get('lon', -73.9),
-                            0.7
-                        ))
-        
-        elif sector == 'maritime':
-            # Use actual port locations
-            ports = self.cache.get('maritime', {}).get('facilities', {})
-            for port_name, port_data in ports.items():
-                loc = port_data.get('location', {})
+        Stored as parallel arrays (lat, lon, intensity, sector) plus an
+        STRtree over the points when shapely is available.
+        """
+        points = []
+        
+        # Use actual airport locations
+        airports = self.aviation_airports.get('airport_codes', {})
+        for code, data in airports.items():
+            points.append((data.get('lat', 40.7), data.get('lon', -73.9), 1.0, 'aviation'))  # Full intensity at airport
+        
+        # Use actual power plant locations
+        plants = self.energy.get('major_substations', [])
+        for plant in plants:
+            loc = plant.get('location', {})
+            points.append((loc.get('lat', 40.7), loc.get('lon', -73.9), 0.8, 'energy'))
+        
+        # Use actual facility locations
+        facilities = self.industry_facilities
+        for facility_type in ['power_plants', 'waste_facilities', 'manufacturing']:
+            for facility in facilities.get(facility_type, []):
+                loc = facility.get('location', {})
                 if loc:
-                    spatial_points.append((
-                        loc.get('lat', 40.7),
-                        loc.get('lon', -73.9),
-                        0.9
-                    ))
+                    points.append((loc.get('lat', 40.7), loc.get('lon', -73.9), 0.7, 'industry'))
+        
+        # Use actual port locations
+        ports = self.maritime.get('facilities', {})
+        for port_name, port_data in ports.items():
+            loc = port_data.get('location', {})
+            if loc:
+                points.append((loc.get('lat', 40.7), loc.get('lon', -73.9), 0.9, 'maritime'))
         
-        return spatial_points
+        lats = np.array([p[0] for p in points], dtype=np.float64)
+        lons = np.array([p[1] for p in points], dtype=np.float64)
+        
+        return {
+            'lats': lats,
+            'lons': lons,
+            'intensities': np.array([p[2] for p in points], dtype=np.float64),
+            'sectors': np.array([p[3] for p in points], dtype=str),
+            'tree': STRtree(shapely.points(lons, lats)) if SHAPELY_AVAILABLE else None,
+        }
 
 
 # Global instance
 _data_loader = None
+_loader_lock = threading.Lock()
 
 def get_data_loader() -> NYCDataLoader:
-    """Get or create global data loader instance"""
+    """Get or create global data loader instance (safe under threaded servers)"""
     global _data_loader
     if _data_loader is None:
-        _data_loader = NYCDataLoader()
+        with _loader_lock:
+            if _data_loader is None:
+                _data_loader = NYCDataLoader()
     return _data_loader
 
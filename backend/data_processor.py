@@ -7,14 +7,33 @@ Integrates real data from multiple sources via data_loader
 import numpy as np
 import pandas as pd
 import requests
-from typing import List, Tuple, Dict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import List, Tuple, Dict, Optional
 from datetime import datetime, timedelta
+import functools
 import json
+import math
+from concurrent.futures import ThreadPoolExecutor
 import os
+import re
+import zlib
+from pathlib import Path
+
+from kernels import NUMBA_AVAILABLE, pattern_variation_stamp, urban_baseline_fill, zone_accumulate
+
+# Optional scipy KD-tree so pattern points only touch nearby grid cells
+try:
+    from scipy.spatial import cKDTree
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+    print("[INFO] scipy not available, spatial patterns will scan the full grid")
 
 # Import geopandas for accurate boundary checking
 try:
     import geopandas as gpd
+    import shapely
     from shapely.geometry import Point
     GEOPANDAS_AVAILABLE = True
 except ImportError:
@@ -23,13 +42,139 @@ except ImportError:
 
 # Import data loader for real data integration
 try:
-    from data_loader import get_data_loader
+    from data_loader import get_data_loader, read_geodata_cached
     DATA_LOADER_AVAILABLE = True
 except ImportError:
     DATA_LOADER_AVAILABLE = False
     print("[WARN] data_loader not available, using synthetic data only")
 
 
+# Real-data baseline grids are cached here, refreshed after BASELINE_CACHE_TTL
+BASELINE_CACHE_DIR = Path('data') / 'cache'
+BASELINE_CACHE_TTL = timedelta(hours=24)
+
+# Degree -> km conversion at NYC's latitude (40.7°N)
+KM_PER_DEG_LAT = 111.0
+KM_PER_DEG_LON_NYC = 111.0 * math.cos(math.radians(40.7))
+
+# Concurrent OpenAQ v3 per-sensor requests (also the HTTP connection pool size)
+OPENAQ_FETCH_WORKERS = 8
+
+# Storage dtype of the emissions grids and intervention patterns. The model is
+# a heuristic, so float32 loses nothing meaningful and halves the bytes every grid sweep moves
+GRID_DTYPE = np.float32
+
+# Simplified water bodies as (min_lat, max_lat, min_lon, max_lon), strict bounds
+WATER_BOXES = np.array([
+    (40.70, 40.88, -np.inf, -74.02),  # Hudson River (west of Manhattan)
+    (40.70, 40.80, -73.98, -73.93),   # East River
+    (-np.inf, 40.62, -74.05, -74.00), # New York Harbor (south)
+])
+
+# Description keywords per intervention model as (keyword, pattern), checked in
+# order against the lowercased description; the first match wins
+DESCRIPTION_KEYWORDS = {
+    'transport': [
+        ('taxi', re.compile(r'taxi|cab')),
+        ('bus', re.compile(r'bus')),
+        ('ev', re.compile(r'ev|electric')),
+    ],
+    'buildings': [
+        ('solar', re.compile(r'solar|panel')),
+        ('green_roof', re.compile(r'green|roof')),
+        ('insulation', re.compile(r'insulation|heating')),
+    ],
+    'industry': [
+        ('manufacturing', re.compile(r'manufacturing')),
+        ('port', re.compile(r'port|shipping')),
+        ('airport', re.compile(r'airport')),
+    ],
+    'energy': [
+        ('solar', re.compile(r'solar|renewable')),
+        ('grid', re.compile(r'grid|power')),
+    ],
+}
+
+# Relative spread of the per-cell AI variation by sector (0.07 otherwise)
+AI_VARIATION_SIGMA = {
+    'transport': 0.08,  # Transport has more linear variation (along roads)
+    'buildings': 0.05,  # Buildings have more uniform variation
+    'industry': 0.12,   # Industry has concentrated variation
+    'energy': 0.06,     # Energy has grid-based variation
+}
+
+
+# Small integer ids mixed into the scenario RNG seeds
+SECTOR_IDS = {'transport': 0, 'buildings': 1, 'industry': 2, 'energy': 3}
+BOROUGH_IDS = {'manhattan': 0, 'brooklyn': 1, 'queens': 2, 'bronx': 3, 'staten island': 4, 'citywide': 5}
+
+
+@functools.lru_cache(maxsize=1024)
+def _description_hash(description: str) -> int:
+    """
+    32-bit CRC of an intervention description, computed once per distinct text
+    
+    Unlike str hash() it is not salted per process, so every worker derives
+    the same pattern for the same prompt.
+    """
+    return zlib.crc32(description.encode('utf-8')) & 0xFFFFFFFF
+
+
+def _scenario_seed(sector: str, description: str, borough: Optional[str] = None,
+                   reduction_percent: float = 0.0) -> int:
+    """32-bit RNG seed for a scenario, mixed from integer components (no formatted string)"""
+    sector_id = SECTOR_IDS.get(sector, 15)
+    borough_id = BOROUGH_IDS.get(borough.lower(), 15) if borough else 14
+    return (int(reduction_percent * 100) ^ (_description_hash(description) << 1) ^
+            (sector_id << 16) ^ (borough_id << 24)) & 0xFFFFFFFF
+
+
+@functools.lru_cache(maxsize=256)
+def _variation_array(seed: int, shape: Tuple[int, ...], sigma: float) -> np.ndarray:
+    """N(0, sigma) draw for a scenario seed, memoized (read-only) since it is deterministic"""
+    variation = np.random.default_rng(seed).normal(0, sigma, shape)
+    variation.setflags(write=False)
+    return variation
+
+
+# Tightened rectangular borough boundaries, used when the GeoJSON polygons
+# are unavailable. Format: (min_lat, max_lat, min_lon, max_lon), keyed by
+# lowercased borough name
+BOROUGH_BOUNDS = {
+    'manhattan': (40.70, 40.88, -74.019, -73.907),
+    'brooklyn': (40.57, 40.74, -74.042, -73.833),
+    'queens': (40.54, 40.80, -73.962, -73.70),
+    'bronx': (40.785, 40.92, -73.933, -73.765),
+    'staten island': (40.495, 40.651, -74.255, -74.053),
+}
+
+# Targets that mean the whole city
+CITYWIDE_TARGETS = frozenset({'citywide', 'all'})
+
+# Extra impact of citywide-sector interventions in the denser boroughs
+CITYWIDE_BOROUGH_MULTIPLIERS = {'manhattan': 1.3, 'brooklyn': 1.1}
+
+# Airport peaks as (lat, lon, peak tonnes CO2/km^2/day)
+AIRPORT_PEAKS = np.array([
+    (40.6413, -73.7781, 1800),  # JFK
+    (40.7769, -73.8740, 1200),  # LaGuardia
+], dtype=np.float64)
+
+# Manhattan commercial hotspots as (lat, lon, tonnes CO2/km^2/day, radius in cells)
+MANHATTAN_HOTSPOTS = np.array([
+    (40.758, -73.9855, 164, 3),   # Midtown/Times Square
+    (40.7074, -74.0113, 146, 2),  # Financial District
+    (40.7870, -73.9754, 129, 2),  # Upper West Side
+], dtype=np.float64)
+
+# Synthetic-baseline hotspots as (lat, lon, intensity)
+SYNTHETIC_HOTSPOTS = np.array([
+    (40.6413, -73.7781, 1000),  # JFK Airport
+    (40.7769, -73.8740, 750),   # LaGuardia Airport
+    (40.7580, -73.9855, 125),   # Times Square / Midtown
+], dtype=np.float64)
+
+
 class NYCEmissionsData:
     """
     Manages NYC emissions data from multiple sources:
@@ -54,6 +199,19 @@ class NYCEmissionsData:
         'Staten Island': {'center': (40.5795, -74.1502), 'intensity': 0.7}
     }
     
+    # Same table as parallel arrays (row k is borough BOROUGH_NAMES[k]) for the grid kernels
+    BOROUGH_NAMES = tuple(BOROUGHS)
+    BOROUGH_CENTERS = np.array([data['center'] for data in BOROUGHS.values()], dtype=np.float64)
+    BOROUGH_INTENSITIES = np.array([data['intensity'] for data in BOROUGHS.values()], dtype=np.float64)
+    
+    # Fixed instance layout (no per-instance __dict__): new state must be declared here
+    __slots__ = (
+        'grid_resolution', '_lat_step', '_lon_step', 'cell_area_km2', 'baseline_cache', 'last_update', 'openaq_cache',
+        'data_loader', 'nyc_boundaries', 'nyc_boundary_union', '_session', '_borough_geometries',
+        '_borough_masks', '_grid_trees', '_grid_meshes', '_distance_fields', '_nyc_masks',
+        '_baseline_points',
+    )
+    
     def __init__(self, grid_resolution=None):
         """
         Initialize with calculated grid resolution for ~1 km² cells
@@ -82,12 +240,20 @@ class NYCEmissionsData:
         self.baseline_cache = None
         self.last_update = None
         self.openaq_cache = None
+        self._session = self._create_http_session()
         self.nyc_boundaries = None
-        
-        # Calculate grid cell area (in km²)
-        lat_step = (self.BOUNDS['north'] - self.BOUNDS['south']) / self.grid_resolution
-        lon_step = (self.BOUNDS['east'] - self.BOUNDS['west']) / self.grid_resolution
-        self.cell_area_km2 = (lat_step * 111) * (lon_step * 111 * np.cos(np.radians(40.7)))
+        self._borough_masks = {}  # (target, lats, lons) -> boolean grid mask
+        self._grid_trees = {}  # (lats, lons) -> KD-tree over the grid cell centers
+        self._grid_meshes = {}  # (lats, lons) -> read-only (LAT, LON) meshgrid
+        self._distance_fields = {}  # (lats, lons, lat, lon) -> distance grid to a fixed site
+        self._nyc_masks = {}  # (lats, lons) -> boolean NYC containment grid mask
+        self._baseline_points = None  # (baseline_cache it was built from, (N, 3) points)
+        
+        # Calculate grid cell size (degrees) and area (in km²), shared by every
+        # baseline generation
+        self._lat_step = (self.BOUNDS['north'] - self.BOUNDS['south']) / self.grid_resolution
+        self._lon_step = (self.BOUNDS['east'] - self.BOUNDS['west']) / self.grid_resolution
+        self.cell_area_km2 = (self._lat_step * KM_PER_DEG_LAT) * (self._lon_step * KM_PER_DEG_LON_NYC)
         print(f"[GRID] Cell area: {self.cell_area_km2:.4f} km² per cell")
         
         # Load NYC borough boundaries from GeoJSON
@@ -98,6 +264,7 @@ class NYCEmissionsData:
         if DATA_LOADER_AVAILABLE:
             try:
                 self.data_loader = get_data_loader()
+                self.data_loader.preload()
                 print("[OK] Real data integration enabled")
             except Exception as e:
                 print(f"[WARN] Could not initialize data loader: {e}")
@@ -119,15 +286,20 @@ class NYCEmissionsData:
                 print(f"[WARN] Borough boundaries file not found: {boundaries_path}")
                 return
             
-            # Load GeoJSON
-            self.nyc_boundaries = gpd.read_file(boundaries_path)
+            # Load GeoJSON (through its GeoParquet copy when available)
+            if DATA_LOADER_AVAILABLE:
+                self.nyc_boundaries = read_geodata_cached(Path(boundaries_path))
+            else:
+                self.nyc_boundaries = gpd.read_file(boundaries_path)
             
             # Ensure it's in WGS84 (EPSG:4326) for lat/lon
             if self.nyc_boundaries.crs != 'EPSG:4326':
                 self.nyc_boundaries = self.nyc_boundaries.to_crs('EPSG:4326')
             
-            # Combine all boroughs into single geometry for faster checking
+            # Combine all boroughs into single geometry for faster checking,
+            # prepared (GEOS edge index) so containment tests skip the full raycast
             self.nyc_boundary_union = self.nyc_boundaries.unary_union
+            shapely.prepare(self.nyc_boundary_union)
             
             print(f"[OK] Loaded NYC boundaries: {len(self.nyc_boundaries)} boroughs")
             print(f"[BOUNDS] Using actual GeoJSON polygons for precise filtering")
@@ -148,6 +320,15 @@ class NYCEmissionsData:
         
         This gives PHYSICS-BASED, ACCURATE emissions instead of synthetic data
         """
+        # Reuse the real-data baseline from a previous run when still valid
+        if self.data_loader:
+            cached = self._load_baseline_from_disk()
+            if cached is not None:
+                self.baseline_cache = cached
+                self.last_update = datetime.now()
+                print(f"[OK] Loaded cached baseline: {self.grid_resolution}x{self.grid_resolution} grid")
+                return
+        
         print("[INFO] Generating REAL data-driven NYC emissions grid...")
         
         # Create lat/lon grid
@@ -155,23 +336,24 @@ class NYCEmissionsData:
         lons = np.linspace(self.BOUNDS['west'], self.BOUNDS['east'], self.grid_resolution)
         
         # Initialize emissions grid
-        emissions_grid = np.zeros((self.grid_resolution, self.grid_resolution))
+        emissions_grid = np.zeros((self.grid_resolution, self.grid_resolution), dtype=GRID_DTYPE)
         
         # Try to use REAL data first
         if self.data_loader:
             try:
                 print("[REAL-DATA] Attempting to generate baseline from real data...")
-                emissions_grid = self._generate_from_real_data(lats, lons)
+                emissions_grid = self._generate_from_real_data(lats, lons).astype(GRID_DTYPE)
                 print("[OK] Using REAL NYC data for baseline")
+                self._save_baseline_to_disk(lats, lons, emissions_grid)
             except Exception as e:
                 import traceback
                 print(f"[WARN] Real data generation failed: {e}")
                 print(f"[DEBUG] Traceback: {traceback.format_exc()}")
                 print("[FALLBACK] Using synthetic baseline")
-                emissions_grid = self._generate_synthetic_baseline(lats, lons)
+                emissions_grid = self._generate_synthetic_baseline(lats, lons).astype(GRID_DTYPE)
         else:
             print(f"[FALLBACK] No data loader available (data_loader={self.data_loader}), using synthetic baseline")
-            emissions_grid = self._generate_synthetic_baseline(lats, lons)
+            emissions_grid = self._generate_synthetic_baseline(lats, lons).astype(GRID_DTYPE)
         
         # Cache the baseline
         self.baseline_cache = (lats, lons, emissions_grid)
@@ -180,6 +362,60 @@ class NYCEmissionsData:
         print(f"[OK] Baseline generated: {self.grid_resolution}x{self.grid_resolution} grid")
         print(f"[STAT] Emission range: {emissions_grid.min():.1f} - {emissions_grid.max():.1f} tonnes CO2/km^2/day")
     
+    def _baseline_cache_path(self) -> Path:
+        """Disk cache file for the real-data baseline at this grid resolution"""
+        return BASELINE_CACHE_DIR / f"baseline_{self.grid_resolution}.npz"
+    
+    def _baseline_source_key(self) -> np.ndarray:
+        """(mtime_ns, size) of the CSVs the real-data baseline is built from"""
+        key = []
+        for name in ('buildings', 'traffic', 'trees'):
+            path = self.data_loader.csv_files.get(name)
+            if path and path.exists():
+                stat = path.stat()
+                key.append((stat.st_mtime_ns, stat.st_size))
+            else:
+                key.append((0, 0))
+        return np.array(key, dtype=np.int64)
+    
+    def _load_baseline_from_disk(self):
+        """
+        (lats, lons, emissions) from the disk cache, or None if missing or stale
+        
+        The real-data baseline is deterministic for a given grid resolution
+        and source CSVs, so it is only rebuilt when one of those changes or
+        the cache is older than BASELINE_CACHE_TTL.
+        """
+        cache_path = self._baseline_cache_path()
+        if not cache_path.exists():
+            return None
+        
+        age = datetime.now() - datetime.fromtimestamp(cache_path.stat().st_mtime)
+        if age > BASELINE_CACHE_TTL:
+            return None
+        
+        try:
+            with np.load(cache_path) as cached:
+                if not np.array_equal(cached['source'], self._baseline_source_key()):
+                    return None
+                return cached['lats'], cached['lons'], cached['emissions'].astype(GRID_DTYPE, copy=False)
+        except Exception as e:
+            print(f"[WARN] Could not read cached baseline {cache_path}: {e}")
+            return None
+    
+    def _save_baseline_to_disk(self, lats: np.ndarray, lons: np.ndarray, emissions: np.ndarray):
+        """Write the real-data baseline to the disk cache (atomically)"""
+        cache_path = self._baseline_cache_path()
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                np.savez(f, lats=lats, lons=lons, emissions=emissions, source=self._baseline_source_key())
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            print(f"[WARN] Could not cache baseline to {cache_path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+    
     def _generate_from_real_data(self, lats, lons):
         """
         Generate emissions grid from REAL NYC data sources
@@ -206,10 +442,9 @@ class NYCEmissionsData:
         # Initialize grid
         emissions_grid = np.zeros((self.grid_resolution, self.grid_resolution))
         
-        # Calculate grid cell size (in km)
-        lat_step = (self.BOUNDS['north'] - self.BOUNDS['south']) / self.grid_resolution
-        lon_step = (self.BOUNDS['east'] - self.BOUNDS['west']) / self.grid_resolution
-        cell_area_km2 = (lat_step * 111) * (lon_step * 111 * np.cos(np.radians(40.7)))  # ~111km per degree latitude
+        # Grid cell size, computed once in __init__
+        lat_step, lon_step = self._lat_step, self._lon_step
+        cell_area_km2 = self.cell_area_km2
         print(f"[GRID] Cell area: {cell_area_km2:.4f} km² ({self.grid_resolution}x{self.grid_resolution} = {self.grid_resolution**2} cells)")
         
         # CALIBRATED TO MATCH NYC ACTUAL INVENTORY
@@ -219,59 +454,40 @@ class NYCEmissionsData:
         
         # 1. AIRPORTS - Peak hotspots (scaled to match actual emissions)
         print("[REAL-DATA] Adding airport emissions hotspots...")
-        airports = [
-            {'name': 'JFK', 'lat': 40.6413, 'lon': -73.7781, 'peak_density_tonne_km2_day': 1800},  # 1,800 metric tonnes/km²/day peak
-            {'name': 'LaGuardia', 'lat': 40.7769, 'lon': -73.8740, 'peak_density_tonne_km2_day': 1200}  # 1,200 metric tonnes/km²/day peak
-        ]
-        
-        for airport in airports:
-            i = int((airport['lat'] - self.BOUNDS['south']) / lat_step)
-            j = int((airport['lon'] - self.BOUNDS['west']) / lon_step)
+        # Distribute airport emissions with Gaussian falloff from peak
+        radius_cells = 6  # Concentrated footprint
+        di, dj = np.ogrid[-radius_cells:radius_cells + 1, -radius_cells:radius_cells + 1]
+        distance = np.sqrt(di**2 + dj**2)
+        # Gaussian falloff from center (peak at center, decays outward)
+        airport_kernel = np.where(distance <= radius_cells,
+                                  np.exp(-distance**2 / (2 * (radius_cells/3.0)**2)), 0.0)
+        
+        for airport_lat, airport_lon, peak_density in AIRPORT_PEAKS:
+            i = int((airport_lat - self.BOUNDS['south']) / lat_step)
+            j = int((airport_lon - self.BOUNDS['west']) / lon_step)
             
             if 0 <= i < self.grid_resolution and 0 <= j < self.grid_resolution:
-                # Distribute airport emissions with Gaussian falloff from peak
-                radius_cells = 6  # Concentrated footprint
-                peak_density = airport['peak_density_tonne_km2_day']
-                
-                for di in range(-radius_cells, radius_cells + 1):
-                    for dj in range(-radius_cells, radius_cells + 1):
-                        ni, nj = i + di, j + dj
-                        if 0 <= ni < self.grid_resolution and 0 <= nj < self.grid_resolution:
-                            distance = np.sqrt(di**2 + dj**2)
-                            if distance <= radius_cells:
-                                # Gaussian falloff from center (peak at center, decays outward)
-                                intensity = np.exp(-distance**2 / (2 * (radius_cells/3.0)**2))
-                                emissions_grid[ni, nj] += peak_density * intensity
+                self._stamp_kernel(emissions_grid, i, j, peak_density * airport_kernel)
         
         # 2. MANHATTAN HOTSPOTS - High-density commercial (scaled +17%)
         print("[REAL-DATA] Adding Manhattan urban hotspots...")
-        hotspots = [
-            {'name': 'Midtown/Times Square', 'lat': 40.758, 'lon': -73.9855, 'emissions_tonne_km2_day': 164, 'radius': 3},
-            {'name': 'Financial District', 'lat': 40.7074, 'lon': -74.0113, 'emissions_tonne_km2_day': 146, 'radius': 2},
-            {'name': 'Upper West Side', 'lat': 40.7870, 'lon': -73.9754, 'emissions_tonne_km2_day': 129, 'radius': 2},
-        ]
-        
-        for hotspot in hotspots:
-            i = int((hotspot['lat'] - self.BOUNDS['south']) / lat_step)
-            j = int((hotspot['lon'] - self.BOUNDS['west']) / lon_step)
-            radius = hotspot.get('radius', 1)
+        for hotspot_lat, hotspot_lon, hotspot_emissions, hotspot_radius in MANHATTAN_HOTSPOTS:
+            i = int((hotspot_lat - self.BOUNDS['south']) / lat_step)
+            j = int((hotspot_lon - self.BOUNDS['west']) / lon_step)
+            radius = int(hotspot_radius)
             
             if 0 <= i < self.grid_resolution and 0 <= j < self.grid_resolution:
                 # Spread hotspot over small radius
-                for di in range(-radius, radius + 1):
-                    for dj in range(-radius, radius + 1):
-                        ni, nj = i + di, j + dj
-                        if 0 <= ni < self.grid_resolution and 0 <= nj < self.grid_resolution:
-                            distance = np.sqrt(di**2 + dj**2)
-                            if distance <= radius:
-                                falloff = 1.0 - (distance / (radius + 1))
-                                emissions_grid[ni, nj] += hotspot['emissions_tonne_km2_day'] * falloff
+                di, dj = np.ogrid[-radius:radius + 1, -radius:radius + 1]
+                distance = np.sqrt(di**2 + dj**2)
+                falloff = np.where(distance <= radius, 1.0 - (distance / (radius + 1)), 0.0)
+                self._stamp_kernel(emissions_grid, i, j, hotspot_emissions * falloff)
         
         # 2.5. REAL BUILDING EMISSIONS - Using actual geocoded building data (LL84)
         print("[REAL-DATA] Adding emissions from geocoded buildings (LL84 dataset)...")
         try:
             # Load building data with actual coordinates
-            buildings_file = self.data_loader.cache['csv_files'].get('buildings') if self.data_loader else None
+            buildings_file = self.data_loader.csv_files.get('buildings') if self.data_loader else None
             
             if buildings_file and buildings_file.exists():
                 print(f"[BUILDINGS] Loading building data from {buildings_file}")
@@ -329,7 +545,7 @@ class NYCEmissionsData:
         # 2.6. TRAFFIC COUNT LOCATIONS - Real traffic sensor data
         print("[REAL-DATA] Adding traffic patterns from sensor data...")
         try:
-            traffic_file = self.data_loader.cache['csv_files'].get('traffic') if self.data_loader else None
+            traffic_file = self.data_loader.csv_files.get('traffic') if self.data_loader else None
             
             if traffic_file and traffic_file.exists():
                 print(f"[TRAFFIC] Loading traffic count data from {traffic_file}")
@@ -385,7 +601,7 @@ class NYCEmissionsData:
         # 2.75. TREE SEQUESTRATION - Trees remove CO2 (negative emissions)
         print("[REAL-DATA] Adding tree sequestration (683K street trees)...")
         try:
-            trees_file = self.data_loader.cache['csv_files'].get('trees') if self.data_loader else None
+            trees_file = self.data_loader.csv_files.get('trees') if self.data_loader else None
             
             if trees_file and trees_file.exists():
                 print(f"[TREES] Loading tree census data from {trees_file}")
@@ -447,25 +663,15 @@ class NYCEmissionsData:
             import traceback
             traceback.print_exc()
         
-        # 3. BOROUGH-BASED BASELINE URBAN EMISSIONS
-        print("[REAL-DATA] Adding borough-based urban baseline...")
-        for i, lat in enumerate(lats):
-            for j, lon in enumerate(lons):
-                if emissions_grid[i, j] < 1000:  # Only fill cells without hotspots
-                    # Calculate based on proximity to borough centers
-                    base_emission = self._calculate_baseline_urban_emission(lat, lon)
-                    emissions_grid[i, j] = max(emissions_grid[i, j], base_emission)
-        
-        # 4. WATER/PARKS - Minimum emissions (2.5-15 tonnes/km²/day)
-        print("[REAL-DATA] Applying water/park modifiers...")
-        for i, lat in enumerate(lats):
-            for j, lon in enumerate(lons):
-                if self._is_over_water(lat, lon):
-                    # Water bodies: minimum 5 tonnes/km²/day (shipping, ferries not fully modeled)
-                    emissions_grid[i, j] = max(5, emissions_grid[i, j] * 0.05)
-
-        # Ensure minimum emissions (parks, low-activity areas)
-        emissions_grid = np.maximum(emissions_grid, 5)  # 5 tonnes/km²/day minimum (scaled +17%)
+        # 3. BOROUGH-BASED BASELINE URBAN EMISSIONS (cells without hotspots,
+        #    see _calculate_baseline_urban_emission)
+        # 4. WATER/PARKS - Water bodies: 5% of the cell, minimum 5 tonnes/km²/day
+        #    (shipping, ferries not fully modeled)
+        # Ensure minimum emissions (parks, low-activity areas): 5 tonnes/km²/day
+        # All three steps run as one fused pass over the grid
+        print("[REAL-DATA] Adding borough-based urban baseline and water/park modifiers...")
+        emissions_grid = urban_baseline_fill(emissions_grid, lats, lons, self.BOROUGH_CENTERS,
+                                             self.BOROUGH_INTENSITIES, WATER_BOXES)
         
         # Calculate and report citywide total for verification
         total_emissions_tonnes_day = np.sum(emissions_grid * cell_area_km2)
@@ -484,18 +690,14 @@ class NYCEmissionsData:
         """
         print("[SYNTHETIC] Generating fallback synthetic baseline...")
         
-        emissions_grid = np.zeros((self.grid_resolution, self.grid_resolution))
-        
-        # Generate emissions based on proximity to borough centers
-        for i, lat in enumerate(lats):
-            for j, lon in enumerate(lons):
-                emission_value = self._calculate_emission_at_point(lat, lon)
-                emissions_grid[i, j] = emission_value
+        # Generate emissions based on proximity to borough centers (whole grid at once)
+        LAT, LON = self._grid_mesh(lats, lons)
+        emissions_grid = self._calculate_emission_at_point(LAT, LON)
         
-        # Add noise for realism
-        noise = np.random.normal(0, 5, emissions_grid.shape)
+        # Add noise for realism (local Generator, no global RNG state)
+        noise = np.random.default_rng().normal(0, 5, emissions_grid.shape)
         emissions_grid += noise
-        emissions_grid = np.maximum(emissions_grid, 0)  # No negative emissions
+        np.maximum(emissions_grid, 0, out=emissions_grid)  # No negative emissions
         
         # Try to incorporate OpenAQ data
         try:
@@ -517,9 +719,7 @@ class NYCEmissionsData:
 
         # Calculate distance to each borough center and apply intensity
         total_intensity = 0
-        for borough, data in self.BOROUGHS.items():
-            center_lat, center_lon = data['center']
-            intensity = data['intensity']
+        for (center_lat, center_lon), intensity in zip(self.BOROUGH_CENTERS, self.BOROUGH_INTENSITIES):
 
             # Euclidean distance (simplified, not geodesic)
             distance = np.sqrt((lat - center_lat)**2 + (lon - center_lon)**2)
@@ -539,68 +739,86 @@ class NYCEmissionsData:
 
         return base_emission + total_intensity
     
-    def _calculate_emission_at_point(self, lat: float, lon: float) -> float:
+    def _calculate_emission_at_point(self, lat, lon):
         """
-        Calculate emission value at a specific point based on NYC geography
+        Calculate emission value at a point based on NYC geography
         FALLBACK method for synthetic baseline only
+        
+        lat/lon may be scalars or broadcastable arrays (e.g. a meshgrid), so
+        the whole grid is evaluated in a few array operations.
         """
-        base_emission = 50  # Base urban emission (50 tonnes CO₂/km²/day)
+        lat = np.asarray(lat, dtype=np.float64)
+        lon = np.asarray(lon, dtype=np.float64)
 
         # Calculate distance to each borough center and apply intensity
-        total_intensity = 0
-        for borough, data in self.BOROUGHS.items():
-            center_lat, center_lon = data['center']
-            intensity = data['intensity']
+        total_intensity = np.zeros(np.broadcast(lat, lon).shape)
+        for (center_lat, center_lon), intensity in zip(self.BOROUGH_CENTERS, self.BOROUGH_INTENSITIES):
 
             # Euclidean distance (simplified, not geodesic)
             distance = np.sqrt((lat - center_lat)**2 + (lon - center_lon)**2)
 
             # Inverse distance weighting with falloff
-            if distance < 0.05:
-                contribution = intensity * 75
-            elif distance < 0.15:
-                contribution = intensity * 50 / (distance * 10 + 1)
-            else:
-                contribution = intensity * 25 / (distance * 20 + 1)
+            contribution = np.where(
+                distance < 0.05,
+                intensity * 75,
+                np.where(
+                    distance < 0.15,
+                    intensity * 50 / (distance * 10 + 1),
+                    intensity * 25 / (distance * 20 + 1)
+                )
+            )
 
             total_intensity += contribution
 
         # Add hotspots (airports, industrial areas) - rescaled
-        hotspots = [
-            (40.6413, -73.7781, 1000),  # JFK Airport
-            (40.7769, -73.8740, 750),   # LaGuardia Airport
-            (40.7580, -73.9855, 125),   # Times Square / Midtown
-        ]
-
-        for spot_lat, spot_lon, spot_intensity in hotspots:
+        for spot_lat, spot_lon, spot_intensity in SYNTHETIC_HOTSPOTS:
             distance = np.sqrt((lat - spot_lat)**2 + (lon - spot_lon)**2)
-            if distance < 0.05:
-                total_intensity += spot_intensity * np.exp(-distance**2 / 0.001)
+            total_intensity += np.where(distance < 0.05, spot_intensity * np.exp(-distance**2 / 0.001), 0.0)
 
         # Lower emissions over water
-        if self._is_over_water(lat, lon):
-            total_intensity *= 0.1
-            base_emission = 5  # Water minimum
+        water = self._is_over_water(lat, lon)
+        total_intensity[water] *= 0.1
+        base_emission = np.where(water, 5, 50)  # Water minimum / base urban emission (tonnes CO₂/km²/day)
 
         return base_emission + total_intensity
     
-    def _is_over_water(self, lat: float, lon: float) -> bool:
+    def _is_over_water(self, lat, lon):
         """
         Simplified check if point is over water (Hudson/East River, NY Harbor)
+        
+        Works on scalars or arrays; returns a boolean mask for arrays.
         """
-        # Hudson River (west of Manhattan)
-        if lon < -74.02 and 40.70 < lat < 40.88:
-            return True
+        lat = np.asarray(lat)
+        lon = np.asarray(lon)
         
-        # East River
-        if -73.98 < lon < -73.93 and 40.70 < lat < 40.80:
-            return True
+        # Hudson River, East River, New York Harbor (see WATER_BOXES)
+        water = np.zeros(np.broadcast(lat, lon).shape, dtype=bool)
+        for min_lat, max_lat, min_lon, max_lon in WATER_BOXES:
+            water |= (lat > min_lat) & (lat < max_lat) & (lon > min_lon) & (lon < max_lon)
         
-        # New York Harbor (south)
-        if lat < 40.62 and -74.05 < lon < -74.00:
-            return True
+        return water
+    
+    @staticmethod
+    def _create_http_session() -> requests.Session:
+        """
+        Shared HTTP session for OpenAQ calls
         
-        return False
+        Keeps the TLS connections alive between requests (one pooled host, one
+        connection per concurrent sensor fetch) and retries transient failures
+        with a short backoff.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=OPENAQ_FETCH_WORKERS,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+        )
+        session.mount('https://', adapter)
+        session.headers.update({
+            'Accept': 'application/json',
+            'User-Agent': 'NYC-CO2-Simulator/1.0 (contact: support@example.com)'
+        })
+        return session
     
     def fetch_openaq_data(self) -> List[Dict]:
         """
@@ -647,12 +865,8 @@ class NYCEmissionsData:
             'radius': 25000,
             'parameters[]': ['pm25']
         }
-        headers = {
-            'Accept': 'application/json',
-            'User-Agent': 'NYC-CO2-Simulator/1.0 (contact: support@example.com)',
-            'X-API-Key': api_key
-        }
-        response = requests.get(url, params=params, headers=headers, timeout=10)
+        headers = {'X-API-Key': api_key}
+        response = self._session.get(url, params=params, headers=headers, timeout=10)
         response.raise_for_status()
         data = response.json()
         sensors = []
@@ -668,36 +882,45 @@ class NYCEmissionsData:
         return sensors
 
     def _fetch_v3_measurements(self, api_key: str, sensors: List[Dict]) -> List[Dict]:
-        """Fetch recent measurements for the provided sensors"""
-        headers = {
-            'Accept': 'application/json',
-            'User-Agent': 'NYC-CO2-Simulator/1.0 (contact: support@example.com)',
-            'X-API-Key': api_key
+        """
+        Fetch recent measurements for the provided sensors
+        
+        One request per sensor, issued concurrently over the pooled session;
+        results keep the sensor order (blending depends on it).
+        """
+        headers = {'X-API-Key': api_key}
+        if not sensors:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(OPENAQ_FETCH_WORKERS, len(sensors))) as executor:
+            per_sensor = executor.map(lambda sensor: self._fetch_v3_sensor_measurements(sensor, headers), sensors)
+            return [measurement for sensor_measurements in per_sensor for measurement in sensor_measurements]
+
+    def _fetch_v3_sensor_measurements(self, sensor: Dict, headers: Dict) -> List[Dict]:
+        """Fetch the latest measurement of a single v3 sensor"""
+        sensor_id = sensor['sensor_id']
+        url = f"https://api.openaq.org/v3/sensors/{sensor_id}/measurements"
+        params = {
+            'limit': 1,
+            'page': 1,
+            'order_by': 'datetime',
+            'sort': 'desc'
         }
+        response = self._session.get(url, params=params, headers=headers, timeout=10)
+        response.raise_for_status()
+        data = response.json()
         measurements = []
-        for sensor in sensors:
-            sensor_id = sensor['sensor_id']
-            url = f"https://api.openaq.org/v3/sensors/{sensor_id}/measurements"
-            params = {
-                'limit': 1,
-                'page': 1,
-                'order_by': 'datetime',
-                'sort': 'desc'
-            }
-            response = requests.get(url, params=params, headers=headers, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            for result in data.get('results', []):
-                value = result.get('value')
-                if value is None:
-                    continue
-                measurements.append({
-                    'lat': sensor['lat'],
-                    'lon': sensor['lon'],
-                    'value': value,
-                    'unit': result.get('parameter', {}).get('units', 'µg/m³'),
-                    'location': sensor['location']
-                })
+        for result in data.get('results', []):
+            value = result.get('value')
+            if value is None:
+                continue
+            measurements.append({
+                'lat': sensor['lat'],
+                'lon': sensor['lon'],
+                'value': value,
+                'unit': result.get('parameter', {}).get('units', 'µg/m³'),
+                'location': sensor['location']
+            })
         return measurements
 
     def _fetch_v2_latest(self) -> List[Dict]:
@@ -712,11 +935,7 @@ class NYCEmissionsData:
             'coordinates': f"{40.7128},{-74.0060}",
             'radius': 25000,
         }
-        headers = {
-            'Accept': 'application/json',
-            'User-Agent': 'NYC-CO2-Simulator/1.0 (contact: support@example.com)'
-        }
-        response = requests.get(url, params=params, headers=headers, timeout=10)
+        response = self._session.get(url, params=params, timeout=10)
         response.raise_for_status()
         data = response.json()
         stations = []
@@ -745,47 +964,60 @@ class NYCEmissionsData:
         
         print(f"[LINK] Blending {len(openaq_data)} OpenAQ measurements into grid...")
         
-        for station in openaq_data:
-            lat = station['lat']
-            lon = station['lon']
-            pm25_value = station['value']
-            
-            # Convert PM2.5 to emission proxy (simplified conversion)
-            # Typical PM2.5: 5-50 Âµg/mÂ³, Emissions: 0.02-0.2 tonnes COâ‚‚/kmÂ²/day
-            emission_proxy = pm25_value * 0.0025
-            
-            # Find nearest grid points and apply influence
-            lat_idx = np.argmin(np.abs(lats - lat))
-            lon_idx = np.argmin(np.abs(lons - lon))
-            
+        # Gaussian kernel over the 5x5 cells around a station, computed once
+        di, dj = np.mgrid[-2:3, -2:3]
+        distance = np.sqrt(di**2 + dj**2)
+        kernel = np.exp(-distance**2 / 2)
+        
+        # lats/lons are uniform (linspace), so the nearest index is arithmetic
+        lat_step = lats[1] - lats[0]
+        lon_step = lons[1] - lons[0]
+        
+        station_lats = np.array([station['lat'] for station in openaq_data], dtype=np.float64)
+        station_lons = np.array([station['lon'] for station in openaq_data], dtype=np.float64)
+        pm25_values = np.array([station['value'] for station in openaq_data], dtype=np.float64)
+        
+        # Convert PM2.5 to emission proxy (simplified conversion)
+        # Typical PM2.5: 5-50 Âµg/mÂ³, Emissions: 0.02-0.2 tonnes COâ‚‚/kmÂ²/day
+        emission_proxies = pm25_values * 0.0025
+        
+        # Find nearest grid points for all stations at once (ties go to the
+        # lower index, stations outside the grid clamp to the edge)
+        lat_indices = np.clip(np.ceil((station_lats - lats[0]) / lat_step - 0.5), 0, len(lats) - 1).astype(np.intp)
+        lon_indices = np.clip(np.ceil((station_lons - lons[0]) / lon_step - 0.5), 0, len(lons) - 1).astype(np.intp)
+        
+        # Stamps are applied in station order: overlapping stations compound
+        # (each blend keeps 70% of the current value), so they cannot be summed
+        for lat_idx, lon_idx, emission_proxy in zip(lat_indices.tolist(), lon_indices.tolist(),
+                                                    emission_proxies.tolist()):
             # Apply with Gaussian kernel (influence nearby cells)
-            for i in range(max(0, lat_idx-2), min(len(lats), lat_idx+3)):
-                for j in range(max(0, lon_idx-2), min(len(lons), lon_idx+3)):
-                    distance = np.sqrt((i - lat_idx)**2 + (j - lon_idx)**2)
-                    weight = np.exp(-distance**2 / 2)
-                    grid[i, j] = grid[i, j] * 0.7 + emission_proxy * 0.3 * weight
+            i0, i1 = max(0, lat_idx - 2), min(len(lats), lat_idx + 3)
+            j0, j1 = max(0, lon_idx - 2), min(len(lons), lon_idx + 3)
+            weight = kernel[i0 - lat_idx + 2:i1 - lat_idx + 2, j0 - lon_idx + 2:j1 - lon_idx + 2]
+            grid[i0:i1, j0:j1] = grid[i0:i1, j0:j1] * 0.7 + emission_proxy * 0.3 * weight
         
         return grid
     
-    def get_baseline_grid(self) -> List[Tuple[float, float, float]]:
+    def get_baseline_grid(self) -> np.ndarray:
         """
-        Returns baseline grid as list of (lat, lon, value) tuples
+        Returns baseline grid as an (N, 3) array of (lat, lon, value) rows
         Filters to only include points within NYC boundaries
         """
         if self.baseline_cache is None:
             self._generate_baseline()
         
+        # The baseline only changes when baseline_cache is replaced, so its
+        # points are built once per baseline and shared (read-only)
+        if self._baseline_points is not None and self._baseline_points[0] is self.baseline_cache:
+            return self._baseline_points[1]
+        
         lats, lons, emissions = self.baseline_cache
         
         # Convert to list of points, filtering to NYC boundaries only
-        points = []
-        filtered_count = 0
-        for i, lat in enumerate(lats):
-            for j, lon in enumerate(lons):
-                if self._is_in_nyc_boundaries(lat, lon):
-                    points.append((lat, lon, emissions[i, j]))
-                else:
-                    filtered_count += 1
+        points = self._grid_to_points(lats, lons, emissions)
+        points.setflags(write=False)
+        self._baseline_points = (self.baseline_cache, points)
+        filtered_count = len(lats) * len(lons) - len(points)
         
         if filtered_count > 0:
             print(f"[FILTER] Removed {filtered_count} points outside NYC boundaries")
@@ -793,9 +1025,10 @@ class NYCEmissionsData:
         
         return points
     
-    def apply_intervention(self, intervention: Dict) -> List[Tuple[float, float, float]]:
+    def apply_intervention(self, intervention: Dict) -> np.ndarray:
         """
         Apply intervention to emissions grid using geographic-specific modifications
+        Returns an (N, 3) array of (lat, lon, value) rows inside NYC
 
         Args:
             intervention: Dict with keys:
@@ -808,7 +1041,6 @@ class NYCEmissionsData:
             self._generate_baseline()
 
         lats, lons, baseline_emissions = self.baseline_cache
-        modified_emissions = baseline_emissions.copy()
 
         # Handle unrelated prompts - no change to emissions
         if intervention.get('is_unrelated'):
@@ -821,12 +1053,7 @@ class NYCEmissionsData:
                 'is_unrelated': True
             }
             # Return baseline unchanged, filtered to NYC boundaries
-            points = []
-            for i, lat in enumerate(lats):
-                for j, lon in enumerate(lons):
-                    if self._is_in_nyc_boundaries(lat, lon):
-                        points.append((lat, lon, baseline_emissions[i, j]))
-            return points
+            return self.get_baseline_grid()
 
         geographic_modifications = intervention.get('geographic_modifications', [])
         description = intervention.get('description', '')
@@ -835,8 +1062,20 @@ class NYCEmissionsData:
         for mod in geographic_modifications:
             print(f"    - {mod.get('area', 'Unknown')}: {mod.get('change_percent', 0)}% ({mod.get('type', 'unknown')})")
 
+        # No-op interventions (0% rules, neutral 0.5 pattern) leave the baseline untouched
+        ai_pattern = intervention.get('spatial_pattern') or []
+        has_changes = any(mod.get('change_percent', 0) != 0 for mod in geographic_modifications)
+        if not has_changes and all(point[2] == 0.5 for point in ai_pattern):
+            print("[INFO] Intervention has no effective change - returning baseline grid")
+            return self.get_baseline_grid()
+
+        modified_emissions = baseline_emissions.copy()
+
         # Apply each geographic modification
         for mod in geographic_modifications:
+            if mod.get('change_percent', 0) == 0:
+                continue
+
             mod_type = mod.get('type')
             change_percent = mod.get('change_percent', 0) / 100.0  # Convert to decimal
             area = mod.get('area', 'Unknown')
@@ -846,63 +1085,81 @@ class NYCEmissionsData:
                 target_lat = mod.get('lat')
                 target_lon = mod.get('lon')
                 radius_km = mod.get('radius_km', 5)
-                radius_deg = radius_km / 111.0  # Approximate conversion to degrees
+                radius_deg = radius_km / KM_PER_DEG_LAT  # Approximate conversion to degrees
 
                 print(f"[HOTSPOT] Applying {change_percent*100}% to {area} (radius: {radius_km}km)")
 
-                for i, lat in enumerate(lats):
-                    for j, lon in enumerate(lons):
-                        distance = np.sqrt((lat - target_lat)**2 + (lon - target_lon)**2)
-                        if distance < radius_deg:
-                            # Gaussian falloff from center
-                            intensity = np.exp(-distance**2 / (2 * (radius_deg/2.0)**2))
-                            reduction_factor = 1.0 + (change_percent * intensity)
-                            modified_emissions[i, j] *= max(0.01, reduction_factor)
+                if not self._zone_touches_grid(lats, lons, target_lat, target_lon, radius_deg):
+                    print(f"[WARN] Hotspot {area} is outside the grid - skipping")
+                    continue
+
+                # Only the rows/columns within radius_deg of the center can be
+                # inside the circle (lats/lons are sorted)
+                i0 = np.searchsorted(lats, target_lat - radius_deg, side='left')
+                i1 = np.searchsorted(lats, target_lat + radius_deg, side='right')
+                j0 = np.searchsorted(lons, target_lon - radius_deg, side='left')
+                j1 = np.searchsorted(lons, target_lon + radius_deg, side='right')
+                
+                distance = np.sqrt((lats[i0:i1, None] - target_lat)**2 + (lons[None, j0:j1] - target_lon)**2)
+                near = distance < radius_deg
+                # Gaussian falloff from center
+                intensity = np.exp(-distance[near]**2 / (2 * (radius_deg/2.0)**2))
+                reduction_factor = 1.0 + (change_percent * intensity)
+                modified_emissions[i0:i1, j0:j1][near] *= np.maximum(0.01, reduction_factor)
 
             elif mod_type == 'borough':
                 # Apply to entire borough
                 print(f"[BOROUGH] Applying {change_percent*100}% to {area}")
 
-                for i, lat in enumerate(lats):
-                    for j, lon in enumerate(lons):
-                        if self._is_in_target_area(lat, lon, area):
-                            reduction_factor = 1.0 + change_percent
-                            modified_emissions[i, j] *= max(0.01, reduction_factor)
+                in_target = self._compute_borough_mask(lats, lons, area)
+                if not in_target.any():
+                    print(f"[WARN] No grid cells inside {area} - skipping")
+                    continue
+
+                reduction_factor = 1.0 + change_percent
+                modified_emissions[in_target] *= max(0.01, reduction_factor)
 
             elif mod_type == 'baseline':
                 # Apply to citywide baseline (minimum values)
                 print(f"[BASELINE] Applying {change_percent*100}% to citywide minimum")
 
                 # Only modify low-emission areas (< 20 tonnes/km²/day)
-                for i, lat in enumerate(lats):
-                    for j, lon in enumerate(lons):
-                        if baseline_emissions[i, j] < 20:
-                            reduction_factor = 1.0 + change_percent
-                            modified_emissions[i, j] *= max(0.01, reduction_factor)
+                reduction_factor = 1.0 + change_percent
+                modified_emissions[baseline_emissions < 20] *= max(0.01, reduction_factor)
 
         # Apply spatial pattern for visual variation if available
         if 'spatial_pattern' in intervention:
             ai_pattern = intervention['spatial_pattern']
             print(f"[SPATIAL] Applying {len(ai_pattern)} pattern points for visualization")
 
-            for pattern_lat, pattern_lon, pattern_intensity in ai_pattern:
-                for i, lat in enumerate(lats):
-                    for j, lon in enumerate(lons):
-                        distance = np.sqrt((lat - pattern_lat)**2 + (lon - pattern_lon)**2)
+            if len(ai_pattern) > 0:
+                pattern_points = np.asarray(ai_pattern, dtype=np.float64)
+
+                # ~5km radius for subtle variations
+                # Add subtle variation (±10%) based on spatial pattern
+                variations = 1.0 + (pattern_points[:, 2] - 0.5) * 0.2
 
-                        if distance < 0.05:  # ~5km radius for subtle variations
-                            # Add subtle variation (±10%) based on spatial pattern
-                            variation = 1.0 + (pattern_intensity - 0.5) * 0.2
-                            modified_emissions[i, j] *= variation
+                if SCIPY_AVAILABLE and not NUMBA_AVAILABLE:
+                    # Only the cells near each point are visited (one batched KD-tree
+                    # ball query; the radius is padded and the exact cutoff reapplied)
+                    neighbors = self._get_grid_tree(lats, lons).query_ball_point(
+                        pattern_points[:, :2], r=0.05 * (1 + 1e-9)
+                    )
+                    for (pattern_lat, pattern_lon, _), variation, cells in zip(pattern_points, variations, neighbors):
+                        i, j = np.divmod(np.asarray(cells, dtype=np.intp), len(lons))
+                        distance = np.sqrt((lats[i] - pattern_lat)**2 + (lons[j] - pattern_lon)**2)
+                        near = distance < 0.05
+                        modified_emissions[i[near], j[near]] *= variation
+                else:
+                    # All points stamped in one fused grid pass (compiled and
+                    # parallel with numba)
+                    modified_emissions = pattern_variation_stamp(
+                        modified_emissions, lats, lons, pattern_points[:, 0], pattern_points[:, 1],
+                        variations.astype(modified_emissions.dtype), 0.05
+                    )
         
         # Convert to list of points, filtering to NYC boundaries only
-        points = []
-        for i, lat in enumerate(lats):
-            for j, lon in enumerate(lons):
-                if self._is_in_nyc_boundaries(lat, lon):
-                    points.append((lat, lon, modified_emissions[i, j]))
-        
-        return points
+        return self._grid_to_points(lats, lons, modified_emissions)
     
     def _create_ai_spatial_pattern(self, lats: np.ndarray, lons: np.ndarray, 
                                  borough: str, sector: str, description: str, 
@@ -911,11 +1168,8 @@ class NYCEmissionsData:
         Create AI-driven spatial pattern based on intervention specifics
         Uses deterministic algorithms to create unique patterns for each prompt
         """
-        pattern = np.zeros((len(lats), len(lons)))
-        
-        # Create unique seed based on all intervention parameters
-        unique_seed = hash(f"{borough}_{sector}_{description}_{reduction_percent}") % 2**32
-        np.random.seed(unique_seed)
+        # Each sector model draws its noise from its own seeded Generator, so
+        # no global random state is touched
         
         # Base pattern intensity based on reduction percentage
         base_intensity = min(reduction_percent / 100.0, 1.0)
@@ -934,10 +1188,64 @@ class NYCEmissionsData:
         
         return pattern
     
+    @staticmethod
+    def _stamp_kernel(grid: np.ndarray, i: int, j: int, kernel: np.ndarray) -> None:
+        """Add a square (2R+1)x(2R+1) kernel centered on cell (i, j), clipped at the grid edges"""
+        radius = kernel.shape[0] // 2
+        i0, i1 = max(0, i - radius), min(grid.shape[0], i + radius + 1)
+        j0, j1 = max(0, j - radius), min(grid.shape[1], j + radius + 1)
+        grid[i0:i1, j0:j1] += kernel[i0 - i + radius:i1 - i + radius, j0 - j + radius:j1 - j + radius]
+    
+    @staticmethod
+    def _match_description(description: str, sector: str) -> Optional[str]:
+        """First DESCRIPTION_KEYWORDS entry for the sector found in the description, or None"""
+        text = description.lower()
+        for keyword, keyword_pattern in DESCRIPTION_KEYWORDS[sector]:
+            if keyword_pattern.search(text):
+                return keyword
+        return None
+    
+    @staticmethod
+    def _zone_touches_grid(lats: np.ndarray, lons: np.ndarray,
+                           site_lat: float, site_lon: float, radius: float) -> bool:
+        """Cheap bounding-box test: can any cell lie within radius of the site?"""
+        return (lats[0] - radius <= site_lat <= lats[-1] + radius and
+                lons[0] - radius <= site_lon <= lons[-1] + radius)
+    
+    def _apply_zones(self, pattern: np.ndarray, lats: np.ndarray, lons: np.ndarray,
+                     in_target: np.ndarray, zones: List[Tuple[float, float, float]],
+                     base_intensity: float, radius: float, falloff: float) -> np.ndarray:
+        """
+        Add (lat, lon, weight) zones to a pattern in place
+        
+        Cells in the target mask within radius (degrees) of a zone get
+        weight * base_intensity * (1 - distance * falloff).
+        """
+        if not zones:
+            return pattern
+        
+        if NUMBA_AVAILABLE:
+            # All zones fused into one compiled, parallel grid pass
+            zone_table = np.asarray(zones, dtype=np.float64)
+            pattern[...] = zone_accumulate(
+                pattern, lats, lons, in_target, zone_table[:, 0], zone_table[:, 1], zone_table[:, 2],
+                float(base_intensity), float(radius), float(falloff)
+            )
+            return pattern
+        
+        # One masked update per zone over its cached distance field
+        for zone_lat, zone_lon, weight in zones:
+            if not self._zone_touches_grid(lats, lons, zone_lat, zone_lon, radius):
+                continue
+            distance = self._distance_field(lats, lons, zone_lat, zone_lon)
+            near = in_target & (distance < radius)
+            pattern[near] += weight * base_intensity * (1 - distance[near] * falloff)
+        return pattern
+    
     def _model_transport_intervention(self, lats: np.ndarray, lons: np.ndarray, 
                                     borough: str, description: str, base_intensity: float) -> np.ndarray:
         """AI-driven transport intervention modeling"""
-        pattern = np.zeros((len(lats), len(lons)))
+        pattern = np.zeros((len(lats), len(lons)), dtype=GRID_DTYPE)
         
         # NYC major transportation corridors
         transport_corridors = {
@@ -973,50 +1281,41 @@ class NYCEmissionsData:
             corridors = [corridor for borough_corridors in transport_corridors.values() 
                         for corridor in borough_corridors]
         
-        # Apply corridor-based patterns
-        for corridor_lon, corridor_lat, intensity in corridors:
-            for i, lat in enumerate(lats):
-                for j, lon in enumerate(lons):
-                    if self._is_in_target_area(lat, lon, borough):
-                        distance = np.sqrt((lat - corridor_lat)**2 + (lon - corridor_lon)**2)
-                        if distance < 0.03:  # Within ~3km
-                            corridor_effect = intensity * base_intensity * (1 - distance * 20)
-                            pattern[i, j] += corridor_effect
+        # Target borough mask, computed once and shared by every corridor
+        in_target = self._compute_borough_mask(lats, lons, borough)
+        
+        # Apply corridor-based patterns (corridors are stored lon-first), within ~3km
+        self._apply_zones(pattern, lats, lons, in_target,
+                          [(corridor_lat, corridor_lon, intensity) for corridor_lon, corridor_lat, intensity in corridors],
+                          base_intensity, radius=0.03, falloff=20)
         
         # Add description-specific variations
-        if 'taxi' in description.lower() or 'cab' in description.lower():
+        keyword = self._match_description(description, 'transport')
+        if keyword == 'taxi':
             # Taxis concentrate in commercial areas (borough-specific)
-            for i, lat in enumerate(lats):
-                for j, lon in enumerate(lons):
-                    if self._is_in_target_area(lat, lon, borough):
-                        # Apply taxi concentration effect within the target borough
-                        pattern[i, j] *= 1.5
-        elif 'bus' in description.lower():
+            pattern[in_target] *= 1.5
+        elif keyword == 'bus':
             # Buses follow major routes
-            for i, lat in enumerate(lats):
-                for j, lon in enumerate(lons):
-                    if self._is_in_target_area(lat, lon, borough):
-                        pattern[i, j] *= 1.2
-        elif 'ev' in description.lower() or 'electric' in description.lower():
+            pattern[in_target] *= 1.2
+        elif keyword == 'ev':
             # EVs have charging station patterns
-            for i, lat in enumerate(lats):
-                for j, lon in enumerate(lons):
-                    if self._is_in_target_area(lat, lon, borough):
-                        pattern[i, j] *= 1.3
+            pattern[in_target] *= 1.3
         
         # Add deterministic noise based on description
-        noise_seed = hash(f"transport_{description}") % 2**32
-        np.random.seed(noise_seed)
-        noise = np.random.normal(0.2, 0.1, pattern.shape)
+        noise_seed = _scenario_seed('transport', description)
+        rng = np.random.default_rng(noise_seed)
+        noise = rng.standard_normal(pattern.shape, dtype=GRID_DTYPE)  # N(0.2, 0.1), drawn in float32
+        noise *= 0.1
+        noise += 0.2
         pattern += noise
-        pattern = np.clip(pattern, 0, 2)
+        np.clip(pattern, 0, 2, out=pattern)
         
         return pattern
     
     def _model_buildings_intervention(self, lats: np.ndarray, lons: np.ndarray, 
                                     borough: str, description: str, base_intensity: float) -> np.ndarray:
         """AI-driven buildings intervention modeling"""
-        pattern = np.zeros((len(lats), len(lons)))
+        pattern = np.zeros((len(lats), len(lons)), dtype=GRID_DTYPE)
         
         # NYC building density zones
         building_zones = {
@@ -1052,54 +1351,46 @@ class NYCEmissionsData:
             zones = [zone for borough_zones in building_zones.values() 
                     for zone in borough_zones]
         
-        # Apply building density patterns
-        for zone_lat, zone_lon, density in zones:
-            for i, lat in enumerate(lats):
-                for j, lon in enumerate(lons):
-                    if self._is_in_target_area(lat, lon, borough):
-                        distance = np.sqrt((lat - zone_lat)**2 + (lon - zone_lon)**2)
-                        if distance < 0.04:  # Within ~4km
-                            zone_effect = density * base_intensity * (1 - distance * 15)
-                            pattern[i, j] += zone_effect
+        # Target borough mask, computed once for all zones and variations
+        in_target = self._compute_borough_mask(lats, lons, borough)
+        
+        # Apply building density patterns, within ~4km
+        self._apply_zones(pattern, lats, lons, in_target, zones, base_intensity, radius=0.04, falloff=15)
         
         # Add description-specific variations
-        if 'solar' in description.lower() or 'panel' in description.lower():
+        keyword = self._match_description(description, 'buildings')
+        if keyword == 'solar':
             # Solar panels work better on south-facing roofs
-            for i, lat in enumerate(lats):
-                for j, lon in enumerate(lons):
-                    if self._is_in_target_area(lat, lon, borough):
-                        # Higher impact in areas with more sun exposure
-                        pattern[i, j] *= 1.3
-        elif 'green' in description.lower() or 'roof' in description.lower():
+            # Higher impact in areas with more sun exposure
+            pattern[in_target] *= 1.3
+        elif keyword == 'green_roof':
             # Green roofs work better on flat roofs (commercial buildings)
-            for i, lat in enumerate(lats):
-                for j, lon in enumerate(lons):
-                    if self._is_in_target_area(lat, lon, borough):
-                        # Commercial areas get more green roof impact
-                        if 40.70 < lat < 40.80 and -74.02 < lon < -73.93:
-                            pattern[i, j] *= 1.4
-                        else:
-                            pattern[i, j] *= 1.1
-        elif 'insulation' in description.lower() or 'heating' in description.lower():
+            # Commercial areas get more green roof impact
+            commercial = (
+                ((lats > 40.70) & (lats < 40.80))[:, None] &
+                ((lons > -74.02) & (lons < -73.93))[None, :]
+            )
+            pattern[in_target & commercial] *= 1.4
+            pattern[in_target & ~commercial] *= 1.1
+        elif keyword == 'insulation':
             # Insulation affects older buildings more
-            for i, lat in enumerate(lats):
-                for j, lon in enumerate(lons):
-                    if self._is_in_target_area(lat, lon, borough):
-                        pattern[i, j] *= 1.2
+            pattern[in_target] *= 1.2
         
         # Add deterministic noise based on description
-        noise_seed = hash(f"buildings_{description}") % 2**32
-        np.random.seed(noise_seed)
-        noise = np.random.normal(0.15, 0.08, pattern.shape)
+        noise_seed = _scenario_seed('buildings', description)
+        rng = np.random.default_rng(noise_seed)
+        noise = rng.standard_normal(pattern.shape, dtype=GRID_DTYPE)  # N(0.15, 0.08), drawn in float32
+        noise *= 0.08
+        noise += 0.15
         pattern += noise
-        pattern = np.clip(pattern, 0, 2)
+        np.clip(pattern, 0, 2, out=pattern)
         
         return pattern
     
     def _model_industry_intervention(self, lats: np.ndarray, lons: np.ndarray, 
                                    borough: str, description: str, base_intensity: float) -> np.ndarray:
         """AI-driven industry intervention modeling"""
-        pattern = np.zeros((len(lats), len(lons)))
+        pattern = np.zeros((len(lats), len(lons)), dtype=GRID_DTYPE)
         
         # NYC industrial zones
         industrial_zones = {
@@ -1131,63 +1422,45 @@ class NYCEmissionsData:
             zones = [zone for borough_zones in industrial_zones.values() 
                     for zone in borough_zones]
         
-        # Apply industrial zone patterns
-        for zone_lat, zone_lon, intensity in zones:
-            for i, lat in enumerate(lats):
-                for j, lon in enumerate(lons):
-                    if self._is_in_target_area(lat, lon, borough):
-                        distance = np.sqrt((lat - zone_lat)**2 + (lon - zone_lon)**2)
-                        if distance < 0.05:  # Within ~5km
-                            zone_effect = intensity * base_intensity * (1 - distance * 12)
-                            pattern[i, j] += zone_effect
+        # Target borough mask, computed once for all zones and variations
+        in_target = self._compute_borough_mask(lats, lons, borough)
+        
+        # Apply industrial zone patterns, within ~5km
+        self._apply_zones(pattern, lats, lons, in_target, zones, base_intensity, radius=0.05, falloff=12)
         
         # Add description-specific variations
-        if 'manufacturing' in description.lower():
+        keyword = self._match_description(description, 'industry')
+        if keyword == 'manufacturing':
             # Manufacturing concentrates in specific zones
-            for i, lat in enumerate(lats):
-                for j, lon in enumerate(lons):
-                    if self._is_in_target_area(lat, lon, borough):
-                        pattern[i, j] *= 1.3
-        elif 'port' in description.lower() or 'shipping' in description.lower():
+            pattern[in_target] *= 1.3
+        elif keyword == 'port':
             # Port activities concentrate near water
-            for i, lat in enumerate(lats):
-                for j, lon in enumerate(lons):
-                    if self._is_in_target_area(lat, lon, borough):
-                        if self._is_near_water(lat, lon):
-                            pattern[i, j] *= 1.5
-        elif 'airport' in description.lower():
+            near_water = self._is_near_water(lats[:, None], lons[None, :])
+            pattern[in_target & near_water] *= 1.5
+        elif keyword == 'airport':
             # Airport-specific interventions
-            for i, lat in enumerate(lats):
-                for j, lon in enumerate(lons):
-                    if self._is_in_target_area(lat, lon, borough):
-                        pattern[i, j] *= 1.4
+            pattern[in_target] *= 1.4
         
         # Add deterministic noise based on description
-        noise_seed = hash(f"industry_{description}") % 2**32
-        np.random.seed(noise_seed)
-        noise = np.random.normal(0.1, 0.05, pattern.shape)
+        noise_seed = _scenario_seed('industry', description)
+        rng = np.random.default_rng(noise_seed)
+        noise = rng.standard_normal(pattern.shape, dtype=GRID_DTYPE)  # N(0.1, 0.05), drawn in float32
+        noise *= 0.05
+        noise += 0.1
         pattern += noise
-        pattern = np.clip(pattern, 0, 2)
+        np.clip(pattern, 0, 2, out=pattern)
         
         return pattern
     
-    def _is_near_water(self, lat: float, lon: float) -> bool:
-        """Check if point is near water (simplified)"""
-        # Hudson River (west of Manhattan)
-        if lon < -74.02 and 40.70 < lat < 40.88:
-            return True
-        # East River
-        if -73.98 < lon < -73.93 and 40.70 < lat < 40.80:
-            return True
-        # New York Harbor
-        if lat < 40.62 and -74.05 < lon < -74.00:
-            return True
-        return False
+    def _is_near_water(self, lat, lon):
+        """Check if point is near water (simplified; scalars or arrays)"""
+        # Same Hudson / East River / Harbor boxes as _is_over_water
+        return self._is_over_water(lat, lon)
     
     def _model_energy_intervention(self, lats: np.ndarray, lons: np.ndarray, 
                                  borough: str, description: str, base_intensity: float) -> np.ndarray:
         """AI-driven energy intervention modeling"""
-        pattern = np.ones((len(lats), len(lons))) * 0.8 * base_intensity
+        pattern = np.full((len(lats), len(lons)), 0.8 * base_intensity, dtype=GRID_DTYPE)
         
         # NYC energy consumption zones
         energy_zones = {
@@ -1218,86 +1491,59 @@ class NYCEmissionsData:
             zones = [zone for borough_zones in energy_zones.values() 
                     for zone in borough_zones]
         
-        # Apply energy consumption patterns
-        for zone_lat, zone_lon, consumption in zones:
-            for i, lat in enumerate(lats):
-                for j, lon in enumerate(lons):
-                    if self._is_in_target_area(lat, lon, borough):
-                        distance = np.sqrt((lat - zone_lat)**2 + (lon - zone_lon)**2)
-                        if distance < 0.03:  # Within ~3km
-                            zone_effect = consumption * base_intensity * (1 - distance * 20)
-                            pattern[i, j] += zone_effect
+        # Target borough mask, computed once for all zones and variations
+        in_target = self._compute_borough_mask(lats, lons, borough)
+        
+        # Apply energy consumption patterns, within ~3km
+        self._apply_zones(pattern, lats, lons, in_target, zones, base_intensity, radius=0.03, falloff=20)
         
         # Add description-specific variations
-        if 'solar' in description.lower() or 'renewable' in description.lower():
+        keyword = self._match_description(description, 'energy')
+        if keyword == 'solar':
             # Solar/renewable energy has different distribution patterns
-            for i, lat in enumerate(lats):
-                for j, lon in enumerate(lons):
-                    if self._is_in_target_area(lat, lon, borough):
-                        pattern[i, j] *= 1.2
-        elif 'grid' in description.lower() or 'power' in description.lower():
+            pattern[in_target] *= 1.2
+        elif keyword == 'grid':
             # Grid improvements affect transmission areas
-            for i, lat in enumerate(lats):
-                for j, lon in enumerate(lons):
-                    if self._is_in_target_area(lat, lon, borough):
-                        pattern[i, j] *= 1.1
+            pattern[in_target] *= 1.1
         
         # Add deterministic noise based on description
-        noise_seed = hash(f"energy_{description}") % 2**32
-        np.random.seed(noise_seed)
-        noise = np.random.normal(0.1, 0.05, pattern.shape)
+        noise_seed = _scenario_seed('energy', description)
+        rng = np.random.default_rng(noise_seed)
+        noise = rng.standard_normal(pattern.shape, dtype=GRID_DTYPE)  # N(0.1, 0.05), drawn in float32
+        noise *= 0.05
+        noise += 0.1
         pattern += noise
-        pattern = np.clip(pattern, 0, 2)
+        np.clip(pattern, 0, 2, out=pattern)
         
         return pattern
     
     def _model_citywide_intervention(self, lats: np.ndarray, lons: np.ndarray, 
                                    borough: str, base_intensity: float) -> np.ndarray:
         """AI-driven citywide intervention modeling"""
-        pattern = np.ones((len(lats), len(lons))) * base_intensity
-        
-        # Citywide interventions have higher impact in denser areas
-        for i, lat in enumerate(lats):
-            for j, lon in enumerate(lons):
-                if self._is_in_target_area(lat, lon, borough):
-                    # Manhattan gets higher impact
-                    if borough.lower() == 'manhattan':
-                        pattern[i, j] *= 1.3
-                    elif borough.lower() == 'brooklyn':
-                        pattern[i, j] *= 1.1
-                    else:
-                        pattern[i, j] *= 1.0
+        pattern = np.full((len(lats), len(lons)), base_intensity, dtype=GRID_DTYPE)
+        
+        # Citywide interventions have higher impact in denser areas; other
+        # targets (including citywide/all) keep the flat pattern, so no mask is built
+        multiplier = CITYWIDE_BOROUGH_MULTIPLIERS.get(borough.lower())
+        if multiplier is not None:
+            pattern[self._compute_borough_mask(lats, lons, borough)] *= multiplier
         
         return pattern
     
     def _add_ai_variation(self, emissions: np.ndarray, sector: str, 
                          borough: str, description: str, reduction_percent: float) -> np.ndarray:
         """Add AI-driven variation based on intervention specifics"""
-        # Create unique variation based on all parameters
-        variation_seed = hash(f"{sector}_{borough}_{description}_{reduction_percent}") % 2**32
-        np.random.seed(variation_seed)
+        # Create unique variation based on all parameters (different spread by sector)
+        variation_seed = _scenario_seed(sector, description, borough, reduction_percent)
+        variation = _variation_array(variation_seed, emissions.shape, AI_VARIATION_SIGMA.get(sector, 0.07))
         
-        # Different variation patterns by sector
-        if sector == 'transport':
-            # Transport has more linear variation (along roads)
-            variation = np.random.normal(0, 0.08, emissions.shape)
-        elif sector == 'buildings':
-            # Buildings have more uniform variation
-            variation = np.random.normal(0, 0.05, emissions.shape)
-        elif sector == 'industry':
-            # Industry has concentrated variation
-            variation = np.random.normal(0, 0.12, emissions.shape)
-        elif sector == 'energy':
-            # Energy has grid-based variation
-            variation = np.random.normal(0, 0.06, emissions.shape)
-        else:
-            variation = np.random.normal(0, 0.07, emissions.shape)
+        # Apply variation in one scratch array (the cached draw is read-only and
+        # the caller's grid is left untouched)
+        varied = np.add(variation, 1.0)
+        varied *= emissions
+        np.maximum(varied, 0.05, out=varied)  # Keep minimum emissions
         
-        # Apply variation
-        emissions = emissions * (1 + variation)
-        emissions = np.maximum(emissions, 0.05)  # Keep minimum emissions
-        
-        return emissions
+        return varied
     
     def _is_in_nyc_boundaries(self, lat: float, lon: float) -> bool:
         """
@@ -1310,74 +1556,176 @@ class NYCEmissionsData:
             return self.nyc_boundary_union.contains(point)
         
         # Fallback: Use rectangular boundaries (less accurate)
-        # Define tightened NYC borough boundaries
-        # Format: (min_lat, max_lat, min_lon, max_lon)
-        borough_bounds = {
-            'Manhattan': (40.70, 40.88, -74.019, -73.907),
-            'Brooklyn': (40.57, 40.74, -74.042, -73.833),
-            'Queens': (40.54, 40.80, -73.962, -73.70),
-            'Bronx': (40.785, 40.92, -73.933, -73.765),
-            'Staten Island': (40.495, 40.651, -74.255, -74.053)
-        }
-        
-        # Check if point is in any borough
-        for borough, (min_lat, max_lat, min_lon, max_lon) in borough_bounds.items():
+        for min_lat, max_lat, min_lon, max_lon in BOROUGH_BOUNDS.values():
             if min_lat <= lat <= max_lat and min_lon <= lon <= max_lon:
                 return True
         
         return False
     
+    def _distance_field(self, lats: np.ndarray, lons: np.ndarray,
+                        site_lat: float, site_lon: float) -> np.ndarray:
+        """
+        Euclidean distance (degrees) from every grid cell to a fixed site
+        
+        The zone/corridor tables are constant, so each site's field is
+        computed once per grid and reused by every intervention. The cached
+        array is read-only.
+        """
+        key = (lats.tobytes(), lons.tobytes(), site_lat, site_lon)
+        if key not in self._distance_fields:
+            distance = np.sqrt((lats[:, None] - site_lat)**2 + (lons[None, :] - site_lon)**2)
+            distance.setflags(write=False)
+            self._distance_fields[key] = distance
+        return self._distance_fields[key]
+    
+    def _get_grid_tree(self, lats: np.ndarray, lons: np.ndarray) -> "cKDTree":
+        """KD-tree over the (lat, lon) grid cell centers, row-major, built once per grid"""
+        key = (lats.tobytes(), lons.tobytes())
+        if key not in self._grid_trees:
+            LAT, LON = self._grid_mesh(lats, lons)
+            self._grid_trees[key] = cKDTree(np.column_stack([LAT.ravel(), LON.ravel()]))
+        return self._grid_trees[key]
+    
+    def _grid_mesh(self, lats: np.ndarray, lons: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (LAT, LON) 'ij' meshgrid of the grid axes, built once per grid
+        
+        Shared by the mask, tree and point-export helpers; the cached arrays
+        are read-only.
+        """
+        key = (lats.tobytes(), lons.tobytes())
+        if key not in self._grid_meshes:
+            LAT, LON = np.meshgrid(lats, lons, indexing='ij')
+            LAT.setflags(write=False)
+            LON.setflags(write=False)
+            self._grid_meshes[key] = (LAT, LON)
+        return self._grid_meshes[key]
+    
+    def _nyc_boundary_mask(self, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+        """Boolean (len(lats), len(lons)) grid mask of _is_in_nyc_boundaries, cached (read-only) per grid"""
+        key = (lats.tobytes(), lons.tobytes())
+        if key in self._nyc_masks:
+            return self._nyc_masks[key]
+        
+        LAT, LON = self._grid_mesh(lats, lons)
+        
+        # Use actual GeoJSON polygons if available
+        if self.nyc_boundaries is not None and GEOPANDAS_AVAILABLE:
+            mask = shapely.contains_xy(self.nyc_boundary_union, LON, LAT)
+        else:
+            # Fallback: Use rectangular boundaries (less accurate)
+            mask = np.zeros(LAT.shape, dtype=bool)
+            for min_lat, max_lat, min_lon, max_lon in BOROUGH_BOUNDS.values():
+                mask |= (LAT >= min_lat) & (LAT <= max_lat) & (LON >= min_lon) & (LON <= max_lon)
+        
+        mask.setflags(write=False)
+        self._nyc_masks[key] = mask
+        return mask
+    
+    def _grid_to_points(self, lats: np.ndarray, lons: np.ndarray,
+                        emissions: np.ndarray) -> np.ndarray:
+        """
+        Contiguous (N, 3) array of (lat, lon, value) rows for the grid cells
+        inside NYC, row-major
+        
+        Kept float64 so the coordinates serialize exactly; callers convert
+        with .tolist() once at the HTTP boundary.
+        """
+        inside = self._nyc_boundary_mask(lats, lons)
+        LAT, LON = self._grid_mesh(lats, lons)
+        return np.stack([LAT[inside], LON[inside], emissions[inside].astype(np.float64)], axis=1)
+    
     def _is_in_target_area(self, lat: float, lon: float, target: str) -> bool:
         """
         Check if point is in target borough using GeoJSON polygons (OPTIMIZED)
         Falls back to rectangular boundaries if GeoJSON not available
         """
-        if target.lower() == 'citywide' or target.lower() == 'all':
+        target_lower = target.lower()
+        if target_lower in CITYWIDE_TARGETS:
             return True
         
         # Use actual GeoJSON polygons if available (MORE ACCURATE!)
         if self.nyc_boundaries is not None and GEOPANDAS_AVAILABLE:
             point = Point(lon, lat)
             
-            # Cache borough name mapping for efficiency
-            if not hasattr(self, '_borough_geometries'):
-                self._borough_geometries = {}
-                for idx, row in self.nyc_boundaries.iterrows():
-                    borough_name = row.get('boro_name', row.get('name', '')).lower()
-                    # Normalize borough names
-                    if 'manhattan' in borough_name or 'new york' in borough_name:
-                        self._borough_geometries['manhattan'] = row['geometry']
-                    elif 'brooklyn' in borough_name or 'kings' in borough_name:
-                        self._borough_geometries['brooklyn'] = row['geometry']
-                    elif 'queens' in borough_name:
-                        self._borough_geometries['queens'] = row['geometry']
-                    elif 'bronx' in borough_name:
-                        self._borough_geometries['bronx'] = row['geometry']
-                    elif 'staten island' in borough_name or 'richmond' in borough_name:
-                        self._borough_geometries['staten island'] = row['geometry']
-            
             # Fast lookup using cached geometry
-            target_normalized = target.lower().strip()
-            if target_normalized in self._borough_geometries:
-                return self._borough_geometries[target_normalized].contains(point)
+            borough_geometries = self._get_borough_geometries()
+            target_normalized = target_lower.strip()
+            if target_normalized in borough_geometries:
+                return borough_geometries[target_normalized].contains(point)
             
             return False
         
         # Fallback: Use rectangular boundaries
-        borough_bounds = {
-            'Manhattan': (40.70, 40.88, -74.019, -73.907),
-            'Brooklyn': (40.57, 40.74, -74.042, -73.833),
-            'Queens': (40.54, 40.80, -73.962, -73.70),
-            'Bronx': (40.785, 40.92, -73.933, -73.765),
-            'Staten Island': (40.495, 40.651, -74.255, -74.053)
-        }
-        
-        if target in borough_bounds:
-            min_lat, max_lat, min_lon, max_lon = borough_bounds[target]
+        bounds = BOROUGH_BOUNDS.get(target_lower.strip())
+        if bounds is not None:
+            min_lat, max_lat, min_lon, max_lon = bounds
             return min_lat <= lat <= max_lat and min_lon <= lon <= max_lon
         
         return True  # Default: apply citywide
     
+    def _get_borough_geometries(self) -> Dict:
+        """Borough polygons keyed by normalized name, built once from the GeoJSON"""
+        # Cache borough name mapping for efficiency
+        if not hasattr(self, '_borough_geometries'):
+            self._borough_geometries = {}
+            for idx, row in self.nyc_boundaries.iterrows():
+                borough_name = row.get('boro_name', row.get('name', '')).lower()
+                # Normalize borough names
+                if 'manhattan' in borough_name or 'new york' in borough_name:
+                    self._borough_geometries['manhattan'] = row['geometry']
+                elif 'brooklyn' in borough_name or 'kings' in borough_name:
+                    self._borough_geometries['brooklyn'] = row['geometry']
+                elif 'queens' in borough_name:
+                    self._borough_geometries['queens'] = row['geometry']
+                elif 'bronx' in borough_name:
+                    self._borough_geometries['bronx'] = row['geometry']
+                elif 'staten island' in borough_name or 'richmond' in borough_name:
+                    self._borough_geometries['staten island'] = row['geometry']
+            shapely.prepare(list(self._borough_geometries.values()))
+        return self._borough_geometries
+    
+    def _compute_borough_mask(self, lats: np.ndarray, lons: np.ndarray, target: str) -> np.ndarray:
+        """
+        Boolean (len(lats), len(lons)) grid mask of _is_in_target_area
+        
+        Evaluated once per target and grid (polygon containment through
+        shapely's vectorized contains_xy) and cached, so intervention models
+        index the mask instead of testing every cell per zone.
+        """
+        # Matching is case- and whitespace-insensitive, so spellings share an entry
+        target_key = target.lower().strip()
+        key = (target_key, lats.tobytes(), lons.tobytes())
+        if key in self._borough_masks:
+            return self._borough_masks[key]
+        
+        shape = (len(lats), len(lons))
+        
+        if target_key in CITYWIDE_TARGETS:
+            mask = np.ones(shape, dtype=bool)
+        elif self.nyc_boundaries is not None and GEOPANDAS_AVAILABLE:
+            geometry = self._get_borough_geometries().get(target_key)
+            if geometry is not None:
+                LAT, LON = self._grid_mesh(lats, lons)
+                mask = shapely.contains_xy(geometry, LON, LAT)
+            else:
+                mask = np.zeros(shape, dtype=bool)
+        else:
+            # Fallback: Use rectangular boundaries
+            bounds = BOROUGH_BOUNDS.get(target_key)
+            if bounds is not None:
+                # A box is separable: two 1-D range tests and one outer AND
+                min_lat, max_lat, min_lon, max_lon = bounds
+                lat_mask = (lats >= min_lat) & (lats <= max_lat)
+                lon_mask = (lons >= min_lon) & (lons <= max_lon)
+                mask = lat_mask[:, None] & lon_mask[None, :]
+            else:
+                mask = np.ones(shape, dtype=bool)  # Default: apply citywide
+        
+        mask.setflags(write=False)
+        self._borough_masks[key] = mask
+        return mask
+    
     def get_cell_area_km2(self) -> float:
         """Returns the area of each grid cell in km²"""
         return self.cell_area_km2
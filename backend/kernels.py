@@ -0,0 +1,202 @@
+"""
+Compiled Numeric Kernels
+Numba-JIT loops for the hot aggregation paths, with NumPy fallbacks
+"""
+
+import numpy as np
+
+# Optional numba for compiled kernels (NumPy fallback otherwise)
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    print("[INFO] numba not available, using NumPy kernels")
+
+
+# ============================================================
+# REDUCTIONS
+# ============================================================
+# NOTE: no fastmath on NaN-aware kernels - it lets LLVM assume values are
+# never NaN and drop the v == v check
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def nan_sum(values):
+        """Sum of a float64 array, skipping NaN"""
+        total = 0.0
+        for i in prange(values.shape[0]):
+            v = values[i]
+            if v == v:
+                total += v
+        return total
+else:
+    def nan_sum(values):
+        """Sum of a float64 array, skipping NaN"""
+        return float(np.nansum(values))
+
+
+# ============================================================
+# SECTOR AGGREGATIONS
+# ============================================================
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def buildings_co2(energy_raw, kwh_per_unit, kg_co2_per_kwh):
+        """
+        Total tons CO2 for building energy use, skipping NaN
+        
+        Unit conversion, grid factor and sum fused into one pass with no
+        intermediate arrays.
+        """
+        total = 0.0
+        for i in prange(energy_raw.shape[0]):
+            v = energy_raw[i]
+            if v == v:
+                total += v * kwh_per_unit * kg_co2_per_kwh
+        return total / 1000.0
+else:
+    def buildings_co2(energy_raw, kwh_per_unit, kg_co2_per_kwh):
+        """Total tons CO2 for building energy use, skipping NaN"""
+        return float(np.nansum(energy_raw)) * kwh_per_unit * kg_co2_per_kwh / 1000.0
+
+
+# ============================================================
+# GRID KERNELS
+# ============================================================
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def urban_baseline_fill(grid, lats, lons, centers, intensities, water_boxes):
+        """
+        Borough urban baseline, water modifier and minimum floor in one pass
+        
+        Cells below 1000 tonnes/km^2/day (no hotspot) are raised to the
+        borough-proximity baseline, cells inside a water box are cut to 5%
+        (minimum 5), and every cell is floored at 5. water_boxes rows are
+        (min_lat, max_lat, min_lon, max_lon), all strict bounds.
+        """
+        out = grid.copy()
+        for i in prange(lats.shape[0]):
+            lat = lats[i]
+            for j in range(lons.shape[0]):
+                lon = lons[j]
+                value = out[i, j]
+                
+                if value < 1000:
+                    total = 0.0
+                    for b in range(centers.shape[0]):
+                        distance = np.sqrt((lat - centers[b, 0])**2 + (lon - centers[b, 1])**2)
+                        if distance < 0.05:
+                            total += intensities[b] * 47
+                        elif distance < 0.15:
+                            total += intensities[b] * 29 / (distance * 10 + 1)
+                        else:
+                            total += intensities[b] * 18 / (distance * 20 + 1)
+                    value = max(value, 29 + total)
+                
+                for w in range(water_boxes.shape[0]):
+                    if (water_boxes[w, 0] < lat < water_boxes[w, 1] and
+                            water_boxes[w, 2] < lon < water_boxes[w, 3]):
+                        value = max(5.0, value * 0.05)
+                        break
+                
+                out[i, j] = max(value, 5.0)
+        return out
+else:
+    def urban_baseline_fill(grid, lats, lons, centers, intensities, water_boxes):
+        """Borough urban baseline, water modifier and minimum floor over the grid"""
+        LAT = lats[:, None]
+        LON = lons[None, :]
+        
+        total = np.zeros(grid.shape)
+        for (center_lat, center_lon), intensity in zip(centers, intensities):
+            distance = np.sqrt((LAT - center_lat)**2 + (LON - center_lon)**2)
+            total += np.where(
+                distance < 0.05,
+                intensity * 47,
+                np.where(distance < 0.15, intensity * 29 / (distance * 10 + 1), intensity * 18 / (distance * 20 + 1))
+            )
+        out = np.where(grid < 1000, np.maximum(grid, 29 + total), grid)
+        
+        water = np.zeros(grid.shape, dtype=bool)
+        for min_lat, max_lat, min_lon, max_lon in water_boxes:
+            water |= (LAT > min_lat) & (LAT < max_lat) & (LON > min_lon) & (LON < max_lon)
+        out = np.where(water, np.maximum(5, out * 0.05), out)
+        
+        return np.maximum(out, 5)
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def pattern_variation_stamp(grid, lats, lons, point_lats, point_lons, variations, radius):
+        """
+        Multiply every cell within radius (degrees) of a pattern point by that
+        point's variation, in point order, in one pass over the grid
+        
+        variations should share grid's dtype so each step rounds like the
+        NumPy in-place multiply it replaces.
+        """
+        out = grid.copy()
+        radius_sq = radius * radius
+        for i in prange(lats.shape[0]):
+            lat = lats[i]
+            for j in range(lons.shape[0]):
+                lon = lons[j]
+                value = out[i, j]
+                for p in range(point_lats.shape[0]):
+                    # Squared distances: the cutoff needs no sqrt
+                    if (lat - point_lats[p])**2 + (lon - point_lons[p])**2 < radius_sq:
+                        value = value * variations[p]
+                out[i, j] = value
+        return out
+else:
+    def pattern_variation_stamp(grid, lats, lons, point_lats, point_lons, variations, radius):
+        """Multiply cells within radius of each pattern point by its variation, in point order"""
+        out = grid.copy()
+        LAT = lats[:, None]
+        LON = lons[None, :]
+        for point_lat, point_lon, variation in zip(point_lats, point_lons, variations):
+            out[(LAT - point_lat)**2 + (LON - point_lon)**2 < radius * radius] *= variation
+        return out
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def zone_accumulate(pattern, lats, lons, in_target, zone_lats, zone_lons, weights,
+                        base_intensity, radius, falloff):
+        """
+        Add (lat, lon, weight) zones to a pattern in one pass over the grid
+        
+        Cells in the target mask within radius (degrees) of a zone get
+        weight * base_intensity * (1 - distance * falloff), added in zone
+        order and stored after every zone so float32 patterns round like the
+        NumPy per-zone update.
+        """
+        out = pattern.copy()
+        radius_sq = radius * radius
+        for i in prange(lats.shape[0]):
+            lat = lats[i]
+            for j in range(lons.shape[0]):
+                if not in_target[i, j]:
+                    continue
+                lon = lons[j]
+                for k in range(zone_lats.shape[0]):
+                    # Cutoff on the squared distance; sqrt only for cells that get the falloff
+                    distance_sq = (lat - zone_lats[k])**2 + (lon - zone_lons[k])**2
+                    if distance_sq < radius_sq:
+                        distance = np.sqrt(distance_sq)
+                        out[i, j] = out[i, j] + weights[k] * base_intensity * (1 - distance * falloff)
+        return out
+else:
+    def zone_accumulate(pattern, lats, lons, in_target, zone_lats, zone_lons, weights,
+                        base_intensity, radius, falloff):
+        """Add (lat, lon, weight) zones to cells of the target mask within radius, in zone order"""
+        out = pattern.copy()
+        LAT = lats[:, None]
+        LON = lons[None, :]
+        for zone_lat, zone_lon, weight in zip(zone_lats, zone_lons, weights):
+            distance_sq = (LAT - zone_lat)**2 + (LON - zone_lon)**2
+            near = in_target & (distance_sq < radius * radius)
+            out[near] += weight * base_intensity * (1 - np.sqrt(distance_sq[near]) * falloff)
+        return out
@@ -5,9 +5,11 @@ Handles data fetching, processing, and AI-powered prompt interpretation
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel
 from typing import List, Dict, Optional
 import numpy as np
+import gc
 import json
 from dotenv import load_dotenv
 import os
@@ -18,7 +20,12 @@ from ai_processor import AIPromptProcessor
 # Load environment variables
 load_dotenv()
 
-app = FastAPI(title="CO₂UNT API", description="AI-Powered Climate Impact Simulator for NYC")
+# orjson encodes the large grid payloads (and any numpy scalars) much faster than stdlib json
+app = FastAPI(
+    title="CO₂UNT API",
+    description="AI-Powered Climate Impact Simulator for NYC",
+    default_response_class=ORJSONResponse
+)
 
 # CORS middleware for frontend communication
 app.add_middleware(
@@ -33,6 +40,15 @@ app.add_middleware(
 emissions_data = NYCEmissionsData()
 ai_processor = AIPromptProcessor()  # Uses ANTHROPIC_API_KEY from environment
 
+# Everything loaded so far is static for the process lifetime. Freezing it keeps
+# the GC from touching those objects, so workers forked after import (e.g.
+# gunicorn --preload) keep sharing the parent's pages instead of copying them
+gc.freeze()
+
+# The baseline only changes when its points array does, so its encoded JSON
+# body is reused across requests: (baseline points array, encoded body)
+_baseline_response_cache = None
+
 
 class SimulationRequest(BaseModel):
     prompt: str
@@ -56,6 +72,34 @@ class SimulationResponse(BaseModel):
     statistics: Optional[Dict] = None  # Real emissions calculations
 
 
+def _calculate_grid_statistics(grid: np.ndarray) -> tuple:
+    """
+    Convert an (N, 3) array of (lat, lon, value) rows to response format and derive all grid statistics
+    
+    Returns:
+        (grid_points, num_points, avg_intensity, cell_area_km2,
+         total_emissions_per_day, coverage_area_km2, annual_emissions)
+    """
+    # Single .tolist() at the HTTP boundary; statistics stay in NumPy
+    grid_points = [
+        {"lat": lat, "lon": lon, "value": value}
+        for lat, lon, value in grid.tolist()
+    ]
+    total_intensity = float(grid[:, 2].sum())
+    
+    num_points = len(grid_points)
+    avg_intensity = total_intensity / num_points if num_points > 0 else 0
+    
+    # Actual total emissions and coverage (intensity × area per cell)
+    cell_area_km2 = emissions_data.get_cell_area_km2()
+    total_emissions_per_day = total_intensity * cell_area_km2
+    coverage_area_km2 = num_points * cell_area_km2
+    annual_emissions = total_emissions_per_day * 365
+    
+    return (grid_points, num_points, avg_intensity, cell_area_km2,
+            total_emissions_per_day, coverage_area_km2, annual_emissions)
+
+
 @app.get("/")
 async def root():
     """Health check endpoint"""
@@ -75,30 +119,18 @@ async def get_baseline():
     Combines real OpenAQ station data with synthetic gridded emissions
     based on NYC geography and known emission patterns
     """
+    global _baseline_response_cache
     try:
         # Fetch and process baseline data (already filtered to NYC boundaries)
         baseline_grid = emissions_data.get_baseline_grid()
         
-        # Convert to response format and calculate statistics
-        grid_points = []
-        total_intensity = 0
-        for lat, lon, value in baseline_grid:
-            grid_points.append({
-                "lat": float(lat),
-                "lon": float(lon),
-                "value": float(value)
-            })
-            total_intensity += value
+        # Unchanged baseline: send the already-encoded body (skips model validation and encoding)
+        if _baseline_response_cache is not None and _baseline_response_cache[0] is baseline_grid:
+            return Response(content=_baseline_response_cache[1], media_type="application/json")
         
-        # Calculate statistics
-        num_points = len(grid_points)
-        avg_intensity = total_intensity / num_points if num_points > 0 else 0
-        
-        # Calculate actual total emissions and coverage (intensity × area per cell)
-        cell_area_km2 = emissions_data.get_cell_area_km2()
-        total_emissions_per_day = total_intensity * cell_area_km2
-        coverage_area_km2 = num_points * cell_area_km2
-        annual_emissions = total_emissions_per_day * 365
+        # Convert to response format and calculate statistics
+        (grid_points, num_points, avg_intensity, cell_area_km2,
+         total_emissions_per_day, coverage_area_km2, annual_emissions) = _calculate_grid_statistics(baseline_grid)
         
         metadata = {
             "city": "New York City",
@@ -120,10 +152,12 @@ async def get_baseline():
             "description": f"Each datapoint represents ~{cell_area_km2:.2f} km² of NYC. Total coverage: {coverage_area_km2:.0f} km² (NYC land + water)"
         }
         
-        return {
+        response = ORJSONResponse({
             "grid": grid_points,
             "metadata": metadata
-        }
+        })
+        _baseline_response_cache = (baseline_grid, response.body)
+        return response
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching baseline data: {str(e)}")
@@ -144,25 +178,8 @@ async def simulate_intervention(request: SimulationRequest):
         simulated_grid = emissions_data.apply_intervention(intervention)
         
         # Convert to response format and calculate statistics
-        grid_points = []
-        total_intensity = 0
-        for lat, lon, value in simulated_grid:
-            grid_points.append({
-                "lat": float(lat),
-                "lon": float(lon),
-                "value": float(value)
-            })
-            total_intensity += value
-        
-        # Calculate statistics
-        num_points = len(grid_points)
-        avg_intensity = total_intensity / num_points if num_points > 0 else 0
-        
-        # Calculate actual total emissions and coverage (intensity × area per cell)
-        cell_area_km2 = emissions_data.get_cell_area_km2()
-        total_emissions_per_day = total_intensity * cell_area_km2
-        coverage_area_km2 = num_points * cell_area_km2
-        annual_emissions = total_emissions_per_day * 365
+        (grid_points, num_points, avg_intensity, cell_area_km2,
+         total_emissions_per_day, coverage_area_km2, annual_emissions) = _calculate_grid_statistics(simulated_grid)
         
         metadata = {
             "city": "New York City",
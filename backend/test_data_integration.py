@@ -41,9 +41,9 @@ def test_aviation_calculations(loader):
     try:
         result = loader.get_emissions_for_sector('aviation', intervention)
         print(f"\n[OK] Aviation calculations successful:")
-        print(f"   Baseline: {result['baseline_tons_co2']:,.0f} tons CO2/year")
-        print(f"   After intervention: {result['reduced_tons_co2']:,.0f} tons CO2/year")
-        print(f"   Annual savings: {result['annual_savings_tons_co2']:,.0f} tons CO2/year")
+        print(f"   Baseline: {result.baseline_tons_co2:,.0f} tons CO2/year")
+        print(f"   After intervention: {result.reduced_tons_co2:,.0f} tons CO2/year")
+        print(f"   Annual savings: {result.annual_savings_tons_co2:,.0f} tons CO2/year")
         return True
     except Exception as e:
         print(f"\n[ERROR] Aviation calculations failed: {e}")
@@ -67,9 +67,9 @@ def test_transport_calculations(loader):
     try:
         result = loader.get_emissions_for_sector('transport', intervention)
         print(f"\n[OK] Transport calculations successful:")
-        print(f"   Baseline: {result['baseline_tons_co2']:,.0f} tons CO2/year")
-        print(f"   After intervention: {result['reduced_tons_co2']:,.0f} tons CO2/year")
-        print(f"   Annual savings: {result['annual_savings_tons_co2']:,.0f} tons CO2/year")
+        print(f"   Baseline: {result.baseline_tons_co2:,.0f} tons CO2/year")
+        print(f"   After intervention: {result.reduced_tons_co2:,.0f} tons CO2/year")
+        print(f"   Annual savings: {result.annual_savings_tons_co2:,.0f} tons CO2/year")
         return True
     except Exception as e:
         print(f"\n[ERROR] Transport calculations failed: {e}")
@@ -77,6 +77,33 @@ def test_transport_calculations(loader):
         traceback.print_exc()
         return False
 
+def test_transport_batch(loader):
+    """Test batched transport calculations match the single-intervention path"""
+    print("\n" + "="*60)
+    print("TEST 3b: Transport Batch Calculations")
+    print("="*60)
+    
+    interventions = [
+        {'sector': 'transport', 'reduction_percent': pct, 'subsector': subsector}
+        for subsector in ('general', 'taxis', 'bus')
+        for pct in (10, 30, 50)
+    ]
+    interventions.append({'sector': 'transport', 'reduction_percent': -15, 'direction': 'increase'})
+    
+    try:
+        batch = loader.get_transport_emissions_batch(interventions)
+        for row, intervention in zip(batch, interventions):
+            single = loader.get_transport_emissions_for_intervention(intervention)
+            assert abs(row['reduced_tons_co2'] - single.reduced_tons_co2) <= 1e-6 * abs(single.baseline_tons_co2)
+            assert bool(row['is_increase']) == single.is_increase
+        print(f"\n[OK] Transport batch of {len(batch)} matches single calculations")
+        return True
+    except Exception as e:
+        print(f"\n[ERROR] Transport batch calculations failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
 def test_buildings_calculations(loader):
     """Test buildings sector emissions calculations"""
     print("\n" + "="*60)
@@ -93,11 +120,11 @@ def test_buildings_calculations(loader):
     try:
         result = loader.get_emissions_for_sector('buildings', intervention)
         print(f"\n[OK] Buildings calculations successful:")
-        print(f"   Baseline: {result['baseline_tons_co2']:,.0f} tons CO2/year")
-        print(f"   After intervention: {result['reduced_tons_co2']:,.0f} tons CO2/year")
-        print(f"   Annual savings: {result['annual_savings_tons_co2']:,.0f} tons CO2/year")
-        if 'buildings_analyzed' in result:
-            print(f"   Buildings analyzed: {result['buildings_analyzed']}")
+        print(f"   Baseline: {result.baseline_tons_co2:,.0f} tons CO2/year")
+        print(f"   After intervention: {result.reduced_tons_co2:,.0f} tons CO2/year")
+        print(f"   Annual savings: {result.annual_savings_tons_co2:,.0f} tons CO2/year")
+        if 'buildings_analyzed' in result.extras:
+            print(f"   Buildings analyzed: {result.extras['buildings_analyzed']}")
         return True
     except Exception as e:
         print(f"\n[ERROR] Buildings calculations failed: {e}")
@@ -120,11 +147,11 @@ def test_energy_calculations(loader):
     try:
         result = loader.get_emissions_for_sector('energy', intervention)
         print(f"\n[OK] Energy calculations successful:")
-        print(f"   Baseline: {result['baseline_tons_co2']:,.0f} tons CO2/year")
-        print(f"   After intervention: {result['reduced_tons_co2']:,.0f} tons CO2/year")
-        print(f"   Annual savings: {result['annual_savings_tons_co2']:,.0f} tons CO2/year")
-        if 'annual_mwh' in result:
-            print(f"   Annual energy: {result['annual_mwh']:,.0f} MWh")
+        print(f"   Baseline: {result.baseline_tons_co2:,.0f} tons CO2/year")
+        print(f"   After intervention: {result.reduced_tons_co2:,.0f} tons CO2/year")
+        print(f"   Annual savings: {result.annual_savings_tons_co2:,.0f} tons CO2/year")
+        if 'annual_mwh' in result.extras:
+            print(f"   Annual energy: {result.extras['annual_mwh']:,.0f} MWh")
         return True
     except Exception as e:
         print(f"\n[ERROR] Energy calculations failed: {e}")
@@ -215,6 +242,7 @@ def main():
     # Test 2-5: Sector-specific calculations
     results.append(("Aviation", test_aviation_calculations(loader)))
     results.append(("Transport", test_transport_calculations(loader)))
+    results.append(("Transport Batch", test_transport_batch(loader)))
     results.append(("Buildings", test_buildings_calculations(loader)))
     results.append(("Energy", test_energy_calculations(loader)))
     